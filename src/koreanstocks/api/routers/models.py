@@ -41,7 +41,7 @@ _EDITABLE_PARAMS: dict[str, list[dict]] = {
     "gradient_boosting": [
         {"key": "max_depth",        "type": "int",   "min": 1,   "max": 4,    "step": 1},
         {"key": "min_samples_leaf", "type": "int",   "min": 15,  "max": 60,   "step": 5},
-        {"key": "subsample",        "type": "float", "min": 0.5, "max": 1.0,  "step": 0.05},
+        {"key": "l2_regularization", "type": "float", "min": 0.0, "max": 10.0, "step": 0.5},
     ],
     "lightgbm": [
         {"key": "max_depth",         "type": "int",   "min": 1,   "max": 4,    "step": 1},
@@ -275,6 +275,10 @@ def train(
         False, "--reset-overrides",
         help="학습 전 모든 override 파일 삭제 — 기본 MODEL_CONFIGS로 초기화 후 재학습",
     ),
+    cache: bool = typer.Option(
+        False, "--cache",
+        help="당일 수집한 학습 데이터·종목별 OHLCV·지표·피처를 data/cache/ 에 저장·재사용 (반복 학습 시 다운로드·지표·피처 계산 생략, --future-days 만 바꾼 재학습 포함)",
+    ),
 ):
     """
     [bold]ML 모델 재학습[/bold] — RF·GB·LGB·CB·XGBRanker·TCN 6-모델 앙상블
@@ -298,6 +302,7 @@ def train(
     [dim]  koreanstocks train --auto-tune --no-save-overrides[/dim]
     [dim]  koreanstocks train --period 1y --future-days 10[/dim]
     [dim]  koreanstocks train --test-ratio 0.3[/dim]
+    [dim]  koreanstocks train --cache                      # 당일 재실행 시 데이터 수집 생략[/dim]
     """
     from koreanstocks.core.engine.trainer import run_training, DEFAULT_TRAINING_STOCKS
 
@@ -310,6 +315,7 @@ def train(
         max_trials=max_trials,
         save_overrides=save_overrides,
         reset_overrides=reset_overrides,
+        use_cache=cache,
     )
 
 
@@ -77,6 +77,13 @@ class Config:
         "https://raw.githubusercontent.com/bullpeng72/KoreanStocks/main/data/storage/stock_analysis.db",
     )
 
+    # 학습 가속 — XGBoost 랭커 학습 장치 ('cpu' | 'cuda' | 'cuda:0' ...)
+    # CUDA 빌드 xgboost + GPU 환경에서만 'cuda' 지정. 저장 모델은 항상 CPU 추론용으로 기록됨
+    XGB_DEVICE: str = os.getenv("KOREANSTOCKS_XGB_DEVICE", "cpu")
+    # RandomForest 학습에 sklearnex(oneDAL, [accel] extra) 사용 — 명시적으로 켤 때만 (기본 off)
+    # 켜면 저장된 RF 모델(.pkl)을 로드하는 추론 환경에도 sklearnex 가 필요해진다
+    USE_SKLEARNEX: bool = os.getenv("KOREANSTOCKS_USE_SKLEARNEX", "0").lower() in ("1", "true", "yes")
+
     # Cache Settings
     CACHE_EXPIRE_STOCKS = 1800  # 30 mins
     CACHE_EXPIRE_MARKET = 300   # 5 mins
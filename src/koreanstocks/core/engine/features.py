@@ -53,6 +53,37 @@ BASE_FEATURE_COLS = [
 ]  # 28개 피처
 
 
+def _pct_change(x: np.ndarray, periods: int) -> np.ndarray:
+    """Series.pct_change(periods) 와 동일한 결과를 NumPy 슬라이스 한 번으로 계산.
+
+    pandas 는 NaN 전방 채움 → shift → 나눗셈을 각각 별도 패스로 수행한다.
+    NaN 이 있을 때만 전방 채움(pandas 기본 fill_method='pad' 와 동일)을 적용한다.
+    """
+    if np.isnan(x).any():
+        x = pd.Series(x).ffill().to_numpy()
+    out = np.full(len(x), np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out[periods:] = x[periods:] / x[:-periods] - 1.0
+    return out
+
+
+def _diff(x: np.ndarray, periods: int) -> np.ndarray:
+    """Series.diff(periods) 의 NumPy 버전 (앞 periods 개는 NaN)."""
+    out = np.full(len(x), np.nan)
+    out[periods:] = x[periods:] - x[:-periods]
+    return out
+
+
+def _ffill(x: np.ndarray) -> np.ndarray:
+    """1-D forward-fill — Series.ffill() 과 동일 (선두 NaN 은 유지)."""
+    missing = np.isnan(x)
+    if not missing.any():
+        return x
+    idx = np.where(missing, 0, np.arange(len(x)))
+    np.maximum.accumulate(idx, out=idx)
+    return x[idx]
+
+
 def build_features(
     df: pd.DataFrame,
     market_df: pd.DataFrame = None,
@@ -71,7 +102,7 @@ def build_features(
 
     Returns
     -------
-    DataFrame  : 유효 행만 포함 (NaN / ±inf 행 제거), 컬럼 = BASE_FEATURE_COLS 교집합
+    DataFrame  : 유효 행만 포함 (NaN / ±inf 행 제거), 컬럼 = BASE_FEATURE_COLS 교집합, dtype = float32
     """
     if df.empty:
         return df
@@ -80,65 +111,94 @@ def build_features(
     if df.index.duplicated().any():
         df = df[~df.index.duplicated(keep='last')]
 
-    feat = pd.DataFrame(index=df.index)
-    tdy  = config.TRADING_DAYS_PER_YEAR   # 252거래일
+    # SoA 구성: 필요한 원본 컬럼을 연속 NumPy 배열로 한 번씩 추출 → 원소별 연산은 NumPy 로,
+    # rolling 계열만 pandas 로 계산. 피처 열은 dict 에 모아 마지막에 (n, F) float32 배열 하나로 기록.
+    cols: dict = {}
+    tdy   = config.TRADING_DAYS_PER_YEAR   # 252거래일
+    n     = len(df)
+    close = df['close'].to_numpy(dtype=np.float64)
 
     # ── 변동성 / 추세 강도 ────────────────────────────────────
-    feat['atr_ratio']   = (df['atr'] / df['close']).rolling(60).rank(pct=True)
-    feat['adx']         = df['adx']
-
-    bb_range            = (df['bb_high'] - df['bb_low']).replace(0, np.nan)
-    feat['bb_position'] = (df['close'] - df['bb_low']) / bb_range
-    feat['bb_width']    = (bb_range / df['bb_mid']).clip(0.01, 0.50)  # ±inf 방지
+    # 비율은 NumPy 로 계산 후 rolling rank 에만 Series 래핑 (Series 나눗셈의 인덱스 정렬 검사 생략)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        atr_close = df['atr'].to_numpy(dtype=np.float64) / close
+    cols['atr_ratio']   = pd.Series(atr_close, index=df.index).rolling(60).rank(pct=True).to_numpy()
+    cols['adx']         = df['adx'].to_numpy()
+
+    bb_low   = df['bb_low'].to_numpy(dtype=np.float64)
+    bb_range = df['bb_high'].to_numpy(dtype=np.float64) - bb_low
+    bb_range[bb_range == 0] = np.nan
+    # 분자 배열에 in-place 로 나누고 clip 도 제자리 적용 → 피처당 결과 배열 1개만 할당 (중간 임시 배열 없음)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        bb_position  = np.subtract(close, bb_low)
+        bb_position /= bb_range
+        bb_width     = np.divide(bb_range, df['bb_mid'].to_numpy(dtype=np.float64))
+        np.clip(bb_width, 0.01, 0.50, out=bb_width)   # ±inf 방지
+    cols['bb_position'] = bb_position
+    cols['bb_width']    = bb_width
 
     # ── 중기 모멘텀 / 상대강도 ────────────────────────────────
-    feat['high_52w_ratio'] = (
-        df['close'] / df['close'].rolling(tdy, min_periods=60).max()
-    )
-    _return_1m = df['close'].pct_change(20)
-    _return_3m = df['close'].pct_change(60)
-    feat['mom_accel'] = _return_1m - _return_3m / 3.0
+    # 52주 고가/저가는 동일 Rolling 객체에서 계산 (pandas rolling max/min 은 단조 덱 기반 O(n))
+    roll_52w   = df['close'].rolling(tdy, min_periods=60)
+    high_52w   = roll_52w.max().to_numpy()
+    low_52w    = roll_52w.min().to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cols['high_52w_ratio'] = close / high_52w
+    _return_1m = _pct_change(close, 20)
+    _return_3m = _pct_change(close, 60)
+    cols['mom_accel'] = _return_1m - _return_3m / 3.0
 
     if market_df is not None and not market_df.empty:
         if market_df.index.duplicated().any():
             market_df = market_df[~market_df.index.duplicated(keep='last')]
-        aligned = market_df.reindex(feat.index).ffill()
-        feat['rs_vs_mkt_3m'] = (_return_3m - aligned.get('return_3m', 0)).fillna(0)
+        # 사용하는 return_3m 한 열만 정수 위치로 정렬 — 시장 프레임 전체 reindex(모든 열 복사) 생략.
+        # 정확히 일치하는 날짜만 가져온 뒤 ffill: 기존 reindex(df.index).ffill() 과 동일 의미
+        if 'return_3m' in market_df.columns:
+            pos    = market_df.index.get_indexer(df.index)
+            mkt_3m = market_df['return_3m'].to_numpy(dtype=np.float64)[pos]
+            mkt_3m[pos < 0] = np.nan
+            mkt_3m = _ffill(mkt_3m)
+        else:
+            mkt_3m = 0.0
+        rs = _return_3m - mkt_3m
+        cols['rs_vs_mkt_3m'] = np.where(np.isnan(rs), 0.0, rs)
     else:
-        feat['rs_vs_mkt_3m'] = 0.0
+        cols['rs_vs_mkt_3m'] = 0.0
 
     # ── 추세 / 가격 모멘텀 ────────────────────────────────────
-    feat['macd_diff']         = df['macd_diff']
-    feat['macd_slope_5d']     = df['macd_diff'].diff(5)
-    feat['price_sma_5_ratio'] = df['close'] / df['sma_5']
+    macd = df['macd_diff'].to_numpy(dtype=np.float64)
+    cols['macd_diff']     = macd
+    cols['macd_slope_5d'] = _diff(macd, 5)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cols['price_sma_5_ratio'] = close / df['sma_5'].to_numpy(dtype=np.float64)
 
     # ── 반전 / 패턴 신호 ─────────────────────────────────────
     if 'fisher' in df.columns:
-        feat['fisher'] = df['fisher']
+        cols['fisher'] = df['fisher'].to_numpy()
     if 'bullish_fractal' in df.columns:
-        feat['bullish_fractal_5d'] = df['bullish_fractal'].rolling(5, min_periods=1).max()
+        cols['bullish_fractal_5d'] = df['bullish_fractal'].rolling(5, min_periods=1).max().to_numpy()
 
     # ── 거래량 방향성 ─────────────────────────────────────────
     if 'mfi' in df.columns:
-        feat['mfi'] = df['mfi']
+        cols['mfi'] = df['mfi'].to_numpy()
     if 'vzo' in df.columns:
-        feat['vzo'] = df['vzo']
+        cols['vzo'] = df['vzo'].to_numpy()
     if 'obv' in df.columns:
         # OBV 10일 모멘텀 → rolling 20일 percentile (0~1)
         # clip(-1, 1) 대신 rank(pct=True) 사용: 급등 OBV(+300%)도 동등 신호 강도 유지
-        feat['obv_trend'] = df['obv'].pct_change(10).rolling(20, min_periods=1).rank(pct=True)
-    feat['low_52w_ratio'] = (
-        df['close'] / df['close'].rolling(tdy, min_periods=60).min()
-    )
+        obv_mom = pd.Series(_pct_change(df['obv'].to_numpy(dtype=np.float64), 10), index=df.index)
+        cols['obv_trend'] = obv_mom.rolling(20, min_periods=1).rank(pct=True).to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cols['low_52w_ratio'] = close / low_52w
 
     # ── 극값 감지 / 반전 신호 ─────────────────────────────────
     if 'rsi' in df.columns:
         # RSI rolling 14일 percentile: 0~1 레짐 독립 정규화
         # /100 단순 나눔 대비 분포가 균일해져 극값(과매도/과매수) 신호 강도 보존
-        feat['rsi'] = df['rsi'].rolling(14, min_periods=1).rank(pct=True)
+        cols['rsi'] = df['rsi'].rolling(14, min_periods=1).rank(pct=True).to_numpy()
     if 'cci' in df.columns:
         # CCI rolling 20일 percentile: 레짐 독립적 0~1 정규화 (±100 이탈 극값 감지)
-        feat['cci_pct'] = df['cci'].rolling(20, min_periods=1).rank(pct=True)
+        cols['cci_pct'] = df['cci'].rolling(20, min_periods=1).rank(pct=True).to_numpy()
 
     # ── 거시경제 ──────────────────────────────────────────────
     # ffill 후에도 커버되지 않는 날짜(macro 시작 이전)는 중립값으로 채움
@@ -155,18 +215,32 @@ def build_features(
         'oil_1m':         0.0,
         'csi300_1m':      0.0,
     }
+    # 컬럼별 선택·fillna 루프 대신 거시 블록 전체를 2-D 로 한 번에 정렬(reindex)·보간·중립값 채움
+    # (없는 심볼 컬럼은 reindex 가 NaN 열로 만들고 중립값으로 채움)
+    macro_defaults = np.array(list(_MACRO_DEFAULTS.values()))
     if macro_df is not None and not macro_df.empty:
         if macro_df.index.duplicated().any():
             macro_df = macro_df[~macro_df.index.duplicated(keep='last')]
-        aligned = macro_df.reindex(feat.index).ffill()
-        for col, default in _MACRO_DEFAULTS.items():
-            feat[col] = (
-                aligned[col].fillna(default)
-                if col in aligned.columns
-                else default
-            )
+        macro_block = (
+            macro_df.reindex(index=df.index, columns=list(_MACRO_DEFAULTS))
+            .ffill()
+            .to_numpy(dtype=np.float64)
+        )
+        # 중립값 채움은 NumPy 브로드캐스트 1회 — DataFrame.fillna(dict) 는 컬럼마다 __setitem__ 을
+        # 거쳐 build_features 전체 시간의 1/3 가량을 차지했음
+        np.copyto(macro_block, macro_defaults, where=np.isnan(macro_block))
     else:
-        for col, default in _MACRO_DEFAULTS.items():
-            feat[col] = default
-
-    return feat.replace([np.inf, -np.inf], np.nan).dropna()
+        macro_block = macro_defaults   # 행 방향 브로드캐스트
+
+    # (n, F) float32 배열 1개에 기록 → DataFrame 은 마지막에 한 번만 래핑.
+    # float32: 트리 모델·TCN 모두 내부적으로 float32 를 사용하며 비율/순위 피처는 fp64 정밀도가
+    # 불필요 → 학습 프레임 메모리·캐시 대역폭 절반 (오버플로로 생긴 inf 는 아래 유한성 마스크가 제거)
+    names = list(cols) + list(_MACRO_DEFAULTS)
+    out   = np.empty((n, len(names)), dtype=np.float32)
+    for j, values in enumerate(cols.values()):
+        out[:, j] = values
+    out[:, len(cols):] = macro_block
+
+    # NaN / ±inf 가 하나라도 있는 행 제거 (replace(inf→NaN) + dropna 를 단일 마스크로 대체)
+    valid = np.isfinite(out).all(axis=1)
+    return pd.DataFrame(out[valid], index=df.index[valid], columns=names)
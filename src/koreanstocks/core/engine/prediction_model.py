@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import StandardScaler
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import FunctionTransformer, StandardScaler
 import joblib
 import logging
 from datetime import datetime
@@ -64,6 +65,82 @@ def _parse_calibration(cal: Any, model_name: str) -> Optional[list]:
     return None
 
 
+def _is_identity_scaler(scaler: Any) -> bool:
+    """학습 시 트리 모델용으로 저장한 항등 변환기(FunctionTransformer(), func=None) 여부."""
+    return isinstance(scaler, FunctionTransformer) and scaler.func is None
+
+
+class _FlatForest:
+    """RandomForestClassifier → 평탄화 노드 배열 추론기 (로드 시 1회 변환).
+
+    sklearn RF 의 predict_proba 는 트리마다 joblib delayed 호출(설정 전파·warnings 필터 포함)을 거쳐
+    1행 추론에도 트리 수 × 수십 µs 가 든다. 모든 트리의 (자식·분할 피처·임계값·잎 확률)을
+    (트리 수, 최대 노드 수) 배열로 모아 두고, 깊이만큼의 NumPy 스텝으로 전체 트리를 동시에 순회한다.
+    비교식(float32 피처 ≤ float64 임계값)·잎 확률 정규화·트리 순서 누적 합산이 sklearn 과 같아
+    결과가 비트 단위로 일치한다. 결측값·피처 이름/개수 불일치 입력은 원본 모델로 위임해
+    sklearn 의 입력 검증(feature_names_in_ · n_features_in_)을 그대로 거친다.
+    트리 내부 구조(tree_)가 예상 형태가 아니면 ValueError — 호출 측은 원본 모델을 사용.
+    """
+
+    def __init__(self, forest: RandomForestClassifier):
+        trees     = [est.tree_ for est in forest.estimators_]
+        n_trees   = len(trees)
+        n_classes = len(forest.classes_)
+        if n_trees == 0 or getattr(forest, 'n_outputs_', 1) != 1:
+            raise ValueError("평탄화 불가: 트리 없음 또는 다중 출력 모델")
+        for t in trees:
+            k = t.node_count
+            if not (
+                t.children_left.shape == t.children_right.shape == t.feature.shape
+                == t.threshold.shape == (k,)
+                and t.value.ndim == 3 and t.value.shape[0] == k and t.value.shape[2] >= n_classes
+            ):
+                raise ValueError("평탄화 불가: 예상과 다른 tree_ 배열 구조")
+        width = max(t.node_count for t in trees)
+        self.forest    = forest
+        self.classes_  = forest.classes_
+        self.n_features_in_    = forest.n_features_in_
+        self.feature_names_in_ = getattr(forest, 'feature_names_in_', None)
+        self.depth     = max(t.max_depth for t in trees)
+        self.left      = np.full((n_trees, width), -1, dtype=np.intp)
+        self.right     = np.full((n_trees, width), -1, dtype=np.intp)
+        self.feature   = np.zeros((n_trees, width), dtype=np.intp)
+        self.threshold = np.zeros((n_trees, width), dtype=np.float64)
+        self.proba     = np.zeros((n_trees, width, n_classes), dtype=np.float64)
+        for i, t in enumerate(trees):
+            k = t.node_count
+            self.left[i, :k]      = t.children_left
+            self.right[i, :k]     = t.children_right
+            self.feature[i, :k]   = np.maximum(t.feature, 0)   # 잎 노드(-2)는 조회만 하고 이동하지 않음
+            self.threshold[i, :k] = t.threshold
+            value      = t.value[:, 0, :n_classes].astype(np.float64)
+            normalizer = value.sum(axis=1, keepdims=True)
+            normalizer[normalizer == 0.0] = 1.0
+            self.proba[i, :k] = value / normalizer
+
+    def predict_proba(self, X) -> np.ndarray:
+        # 학습 시 피처 이름과 순서·구성이 다르면 원본 모델로 위임 → sklearn 이 오류를 발생시킴
+        columns = getattr(X, 'columns', None)
+        if (columns is not None and self.feature_names_in_ is not None
+                and not np.array_equal(np.asarray(columns, dtype=object), self.feature_names_in_)):
+            return self.forest.predict_proba(X)
+        X_arr = np.asarray(X, dtype=np.float32)
+        if X_arr.ndim != 2 or X_arr.shape[1] != self.n_features_in_ or np.isnan(X_arr).any():
+            return self.forest.predict_proba(X)
+        X = X_arr
+        n_trees = self.left.shape[0]
+        trees   = np.arange(n_trees)
+        rows    = np.arange(len(X))[:, None]
+        node    = np.zeros((len(X), n_trees), dtype=np.intp)
+        for _ in range(self.depth):
+            go_left = X[rows, self.feature[trees, node]] <= self.threshold[trees, node]
+            child   = np.where(go_left, self.left[trees, node], self.right[trees, node])
+            node    = np.where(child >= 0, child, node)
+        # 트리 순서대로 누적(cumsum 은 순차 합산) 후 트리 수로 나눔 — sklearn 의 all_proba += ... 와 동일 순서
+        leaf_proba = self.proba[trees, node]                     # (행, 트리, 클래스)
+        return np.cumsum(leaf_proba, axis=1)[:, -1] / n_trees
+
+
 class StockPredictionModel:
     """머신러닝 기반 주가 예측 모델 클래스 (앙상블)"""
 
@@ -133,6 +210,13 @@ class StockPredictionModel:
                     else:
                         self.model_weights[name] = _DEFAULT_MODEL_WEIGHT  # 파라미터 없으면 기본 가중치
 
+                    if type(loaded_model) is RandomForestClassifier:
+                        # sklearn RF 만 평탄화 (sklearnex RF 는 oneDAL 네이티브 추론을 그대로 사용)
+                        # tree_ 구조가 예상과 다르면(sklearn 버전 변경 등) 원본 모델 그대로 사용
+                        try:
+                            loaded_model = _FlatForest(loaded_model)
+                        except (AttributeError, ValueError) as _e:
+                            logger.debug(f"{name} RF 평탄화 생략 — 원본 predict_proba 사용: {_e}")
                     self.models[name]  = loaded_model
                     self.scalers[name] = loaded_scaler
                 except Exception as e:
@@ -290,10 +374,12 @@ class StockPredictionModel:
         for name, model in self.models.items():
             try:
                 scaler = self.scalers.get(name)
-                if scaler is not None:
-                    x = pd.DataFrame(scaler.transform(latest_x.values), columns=feat_cols)
+                if scaler is None or _is_identity_scaler(scaler):
+                    # 트리 모델(항등 변환기): 변환·DataFrame 재구성 없이 원본 피처 행을 그대로 입력
+                    # (predict 는 입력을 수정하지 않으므로 복사도 불필요)
+                    x = latest_x
                 else:
-                    x = latest_x.copy()
+                    x = pd.DataFrame(scaler.transform(latest_x.values), columns=feat_cols)
                 cal = self.calibrations.get(name)
                 w   = self.model_weights.get(name, 0.05)
                 if hasattr(model, 'predict_proba'):
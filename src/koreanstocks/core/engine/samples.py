@@ -0,0 +1,248 @@
+"""
+종목별 학습 샘플 생성 (CPU 경로)
+================================
+OHLCV → 지표 → 피처 → 미래 수익률 → 트리용 샘플 / TCN용 시계열.
+
+trainer.fetch_train_test_samples 의 프로세스 풀 워커가 이 모듈만 import 한다.
+spawn 워커는 작업 함수가 정의된 모듈을 새로 import 하므로, 모델 라이브러리
+(xgboost·lightgbm·catboost·torch)와 데이터 제공자를 끌어오는 trainer.py 대신
+지표·피처 의존성만 가진 이 모듈에 두어 워커 기동 시간·메모리를 줄인다.
+"""
+import hashlib
+import inspect
+import logging
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from koreanstocks.core.engine.indicators import indicators
+from koreanstocks.core.engine.features import build_features, BASE_FEATURE_COLS
+
+logger = logging.getLogger(__name__)
+
+
+def _load_cache_slot(path: Path, key: str) -> Optional[pd.DataFrame]:
+    """종목 슬롯 .npz 로드 — 슬롯에 기록된 내용 해시(key)가 일치할 때만 프레임 반환, 아니면 None."""
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as z:
+            if str(z['key']) != key:
+                return None
+            return pd.DataFrame(
+                z['values'], index=pd.DatetimeIndex(z['dates']), columns=z['columns'].tolist(),
+            )
+    except Exception as e:
+        logger.debug(f"[cache] 캐시 로드 실패 — 재계산: {path.name}: {e}")
+        return None
+
+
+def _save_cache_slot(path: Path, key: str, frame: pd.DataFrame, dtype) -> None:
+    """종목 슬롯 .npz 저장 (값 2-D + 컬럼명 + 날짜 + 내용 해시) — 같은 종목의 이전 결과를 덮어씀."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            path,
+            key=np.array(key),
+            values=frame.to_numpy(dtype=dtype),
+            columns=np.array(frame.columns.tolist()),
+            dates=frame.index.to_numpy(dtype='datetime64[ns]'),
+        )
+    except Exception as e:
+        logger.debug(f"[cache] 캐시 저장 생략: {path.name}: {e}")
+
+
+def calculate_indicators(
+    df: pd.DataFrame, cache_dir: Optional[Path] = None, code: Optional[str] = None,
+) -> pd.DataFrame:
+    """indicators.calculate_all() — cache_dir·code 지정 시 종목별 디스크 캐시 슬롯 사용.
+
+    지표는 OHLCV 에만 의존하므로 (날짜·값 해시)가 같으면 결과도 같다 → 수집 종목 구성이 달라져도
+    변하지 않은 종목의 지표 계산을 건너뛴다. 종목당 파일은 ind_<code>.npz 하나이며, 새 거래일 등으로
+    해시가 바뀌면 재계산 후 같은 파일을 덮어쓴다 (캐시 크기 = 종목 수).
+    저장 형식: .npz (값 float64 2-D + 컬럼명 + 날짜 + 해시) — 숫자 컬럼만 있는 경우에만 캐시.
+    """
+    if cache_dir is None or code is None:
+        return indicators.calculate_all(df)
+
+    # 키 = OHLCV 내용 해시 + 지표 모듈 소스 해시 (지표 로직 변경 시 기존 캐시 자동 무효화)
+    key = hashlib.sha1(Path(inspect.getfile(type(indicators))).read_bytes())
+    key.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    key  = key.hexdigest()[:16]
+    path = cache_dir / f"ind_{code}.npz"
+    df_ind = _load_cache_slot(path, key)
+    if df_ind is not None:
+        return df_ind
+
+    df_ind = indicators.calculate_all(df)
+    _save_cache_slot(path, key, df_ind, np.float64)
+    return df_ind
+
+
+def build_features_cached(
+    df_ind: pd.DataFrame,
+    market_df: pd.DataFrame = None,
+    macro_df: pd.DataFrame = None,
+    cache_dir: Optional[Path] = None,
+    code: Optional[str] = None,
+) -> pd.DataFrame:
+    """build_features() — cache_dir·code 지정 시 종목별 디스크 캐시 슬롯(feat_<code>.npz) 사용.
+
+    피처는 future_days 와 무관하므로 --future-days 만 바꿔 재학습할 때 종목별 피처 빌드를 건너뛰고
+    미래 수익률(타깃)만 다시 계산한다. 슬롯에 기록된 (지표·시장·거시 내용 + features.py 소스) 해시가
+    다르면 재계산 후 덮어쓴다. 저장 형식은 지표 캐시와 동일한 .npz (값은 float32).
+    """
+    if cache_dir is None or code is None:
+        return build_features(df_ind, market_df=market_df, macro_df=macro_df)
+
+    # 값은 float64 로 정규화해 해시 — 지표 캐시에서 읽은 df_ind(float64)와 새로 계산한 df_ind(정수 열 포함)가
+    # 같은 키를 갖도록 dtype 차이를 무시
+    key = hashlib.sha1(Path(inspect.getfile(build_features)).read_bytes())
+    try:
+        for part in (df_ind, market_df, macro_df):
+            if part is not None and not part.empty:
+                key.update(str(part.columns.tolist()).encode())
+                key.update(part.index.to_numpy(dtype='datetime64[ns]').tobytes())
+                key.update(np.ascontiguousarray(part.to_numpy(dtype=np.float64)).tobytes())
+            key.update(b'|')
+    except (TypeError, ValueError):   # 숫자로 변환 불가한 열 → 캐시 없이 계산
+        return build_features(df_ind, market_df=market_df, macro_df=macro_df)
+    key  = key.hexdigest()[:16]
+    path = cache_dir / f"feat_{code}.npz"
+    feat = _load_cache_slot(path, key)
+    if feat is not None:
+        return feat
+
+    feat = build_features(df_ind, market_df=market_df, macro_df=macro_df)
+    _save_cache_slot(path, key, feat, np.float32)
+    return feat
+
+
+def compute_stock_base(
+    df: pd.DataFrame, future_days: int,
+    market_df: pd.DataFrame = None,
+    macro_df: pd.DataFrame = None,
+    ind_cache_dir: Optional[Path] = None,
+    code: Optional[str] = None,
+) -> Optional[tuple]:
+    """지표 계산 → 피처 빌드 → 미래 수익률 (CPU 전용, 프로세스 풀 워커에서도 실행).
+
+    ind_cache_dir·code 지정 시 지표·피처를 종목별 디스크 캐시에서 재사용 — future_days 에 의존하는 것은 마지막 수익률 계산뿐.
+
+    Returns
+    -------
+    (feat_valid, ret_valid, df_ind) 또는 None (데이터 부족 시)
+        feat_valid : DataFrame — 인덱스 = feat.index[:-future_days]
+        ret_valid  : Series   — 동일 인덱스, 미래 수익률
+        df_ind     : DataFrame — indicators.calculate_all() 결과 (TCN 불필요, 참고용)
+    """
+    df_ind = calculate_indicators(df, ind_cache_dir, code)
+    if df_ind.empty:
+        return None
+    feat = build_features_cached(df_ind, market_df=market_df, macro_df=macro_df,
+                                 cache_dir=ind_cache_dir, code=code)
+    if len(feat) <= future_days:
+        return None
+    # 미래 수익률: 피처 날짜 위치의 종가 배열에서 슬라이스 한 번으로 계산
+    # (reindex → shift → 뺄셈 → 나눗셈 → .loc 로 이어지던 Series 임시 객체 제거, 마지막 future_days 행은 라벨 없음)
+    close      = df_ind['close'].to_numpy(dtype=np.float64)[df_ind.index.get_indexer(feat.index)]
+    base       = close[:-future_days]
+    valid_idx  = feat.index[:-future_days]
+    future_ret = pd.Series((close[future_days:] - base) / base, index=valid_idx)
+    return feat.iloc[:-future_days], future_ret, df_ind
+
+
+def collect_stock_features(feat_valid: pd.DataFrame, ret_valid: pd.Series) -> pd.DataFrame:
+    """단일 종목의 (날짜, 특성, 미래수익률) DataFrame 반환."""
+    # feat_valid 는 compute_stock_base 가 잘라 낸 종목 전용 프레임 — 추가 복사 불필요
+    # build_features 가 비유한 행을 이미 제거 → NaN 가능 열은 raw_return 뿐.
+    # 전 열 dropna(subset=...) 스캔 대신 수익률 마스크 하나로 거르고, 모두 유효하면 복사 없이 반환
+    result = feat_valid
+    result['raw_return'] = ret_valid
+    keep = ret_valid.notna().to_numpy()
+    return result if keep.all() else result[keep]
+
+
+def collect_stock_tcn(feat_valid: pd.DataFrame, ret_valid: pd.Series, lookback: int) -> Optional[dict]:
+    """TCN용: 단일 종목의 전체 피처 시계열 + 미래 수익률 반환 (lookback = tcn_model.LOOKBACK).
+
+    Returns:
+        {'features': DataFrame(날짜×피처), 'raw_return': Series}
+        또는 None (데이터 부족 시)
+    """
+    if len(feat_valid) <= lookback:
+        return None
+
+    # feat_valid · ret_valid 는 같은 인덱스이고 피처는 이미 유한값 → 수익률 NaN 마스크 하나로 정렬
+    # (피처 dropna → 수익률 reindex·dropna → 피처 재-reindex 의 3단계 복사 제거)
+    feat_cols  = [c for c in BASE_FEATURE_COLS if c in feat_valid.columns]
+    keep       = ret_valid.notna().to_numpy()
+    feat_clean = feat_valid.loc[keep, feat_cols]
+    ret_align  = ret_valid[keep]
+
+    if len(ret_align) < 30:
+        return None
+
+    # 크로스섹셔널 라벨은 fetch_train_test_samples 가 처리하므로
+    # 여기서는 raw_return만 담아 반환 → 호출 측에서 rank 기반 라벨 변환
+    return {'features': feat_clean, 'raw_return': ret_align}
+
+
+def stock_samples(
+    df: pd.DataFrame, future_days: int,
+    market_df: pd.DataFrame = None,
+    macro_df: pd.DataFrame = None,
+    want_tree: bool = True,
+    tcn_lookback: Optional[int] = None,
+    ind_cache_dir: Optional[Path] = None,
+    code: Optional[str] = None,
+) -> Tuple[pd.DataFrame, Optional[dict]]:
+    """단일 종목 OHLCV → 트리용 샘플 / TCN용 시계열 (지표·피처는 종목당 한 번만 계산).
+
+    tcn_lookback: TCN 시퀀스 길이 (tcn_model.LOOKBACK) — None 이면 TCN 시계열 생략.
+
+    Returns:
+        (tree_df, tcn_data) — 데이터 부족·미요청 시 각각 빈 DataFrame / None
+    """
+    tree_df: pd.DataFrame  = pd.DataFrame()
+    tcn_data: Optional[dict] = None
+    base = compute_stock_base(df, future_days, market_df=market_df, macro_df=macro_df,
+                              ind_cache_dir=ind_cache_dir, code=code)
+    if base is None:
+        return tree_df, tcn_data
+    feat_valid, ret_valid, df_ind = base
+
+    # TCN 은 LOOKBACK 만큼 긴 이력 필요 (트리 최소 길이 60 + LOOKBACK)
+    # 트리 경로가 feat_valid 에 raw_return 을 추가하므로 TCN 슬라이스를 먼저 만든다
+    if tcn_lookback is not None and len(df_ind) >= 60 + tcn_lookback:
+        tcn_data = collect_stock_tcn(feat_valid, ret_valid, tcn_lookback)
+    if want_tree:
+        tree_df = collect_stock_features(feat_valid, ret_valid)
+    return tree_df, tcn_data
+
+
+# ── 프로세스 풀 워커 ─────────────────────────────────────────────────────
+# 시장·거시 프레임은 종목마다 피클링하지 않고 워커 초기화 시 1회만 전달
+_WORKER_CTX: dict = {}
+
+
+def init_worker(market_df: Optional[pd.DataFrame],
+                macro_df: Optional[pd.DataFrame],
+                ind_cache_dir: Optional[Path] = None) -> None:
+    _WORKER_CTX['market_df']     = market_df
+    _WORKER_CTX['macro_df']      = macro_df
+    _WORKER_CTX['ind_cache_dir'] = ind_cache_dir
+
+
+def stock_samples_worker(
+    df: pd.DataFrame, future_days: int, want_tree: bool, tcn_lookback: Optional[int],
+    code: Optional[str] = None,
+) -> Tuple[pd.DataFrame, Optional[dict]]:
+    return stock_samples(
+        df, future_days,
+        market_df=_WORKER_CTX.get('market_df'), macro_df=_WORKER_CTX.get('macro_df'),
+        want_tree=want_tree, tcn_lookback=tcn_lookback,
+        ind_cache_dir=_WORKER_CTX.get('ind_cache_dir'), code=code,
+    )
@@ -5,7 +5,10 @@ koreanstocks train 명령어 및 train_models.py 양쪽에서 호출되는 공
 패키지에 포함되므로 pip/pipx 전역설치 환경에서도 동작합니다.
 """
 
+import hashlib
 import json
+import multiprocessing
+import os
 import socket
 from pathlib import Path
 import time
@@ -14,11 +17,16 @@ import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as _FuturesTimeout
+from concurrent.futures import (
+    ProcessPoolExecutor, ThreadPoolExecutor, as_completed, TimeoutError as _FuturesTimeout,
+)
+from concurrent.futures.process import BrokenProcessPool
 
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
-from sklearn.preprocessing import StandardScaler
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.preprocessing import FunctionTransformer, StandardScaler
 from sklearn.metrics import roc_auc_score, log_loss
+from sklearn.inspection import permutation_importance
+from threadpoolctl import threadpool_limits
 import joblib
 import xgboost as xgb
 import lightgbm as lgb
@@ -27,16 +35,30 @@ from catboost import CatBoostClassifier
 from koreanstocks.core.config import config
 from koreanstocks.core.constants import MIN_MODEL_AUC, AUTO_TUNE_THRESHOLDS
 from koreanstocks.core.data.provider import data_provider, fetch_macro_df, fetch_market_df
-from koreanstocks.core.engine.indicators import indicators
-from koreanstocks.core.engine.features import build_features, BASE_FEATURE_COLS
+from koreanstocks.core.engine.features import BASE_FEATURE_COLS
+from koreanstocks.core.engine.samples import (
+    init_worker, stock_samples, stock_samples_worker,
+)
 from koreanstocks.core.engine import tcn_model as _tcn
 
+# Intel Extension for Scikit-learn (선택적, [accel] extra) — KOREANSTOCKS_USE_SKLEARNEX=1 일 때만
+# RandomForest 를 oneDAL 구현(동일 API · 동일 파라미터)으로 대체한다.
+# 기본은 sklearn RF: 저장 모델(.pkl)이 [accel] extra 없이 로드되고 예측기의 평탄화 추론도 적용된다.
+_SKLEARNEX_OK = False
+if config.USE_SKLEARNEX:
+    try:
+        from sklearnex.ensemble import RandomForestClassifier
+        _SKLEARNEX_OK = True
+    except ImportError:
+        pass   # 미설치 → sklearn RF 유지 (run_training 시작 시 경고)
+
 logger = logging.getLogger("koreanstocks.trainer")
 
 # ───────────────────────────── 경로 설정 ─────────────────────────────
 
 MODEL_DIR  = Path(config.BASE_DIR) / "models" / "saved" / "prediction_models"
 PARAMS_DIR = Path(config.BASE_DIR) / "models" / "saved" / "model_params"
+CACHE_DIR  = Path(config.BASE_DIR) / "data" / "cache"   # --cache 학습 데이터 캐시 (.npy mmap)
 
 # ───────────────────────────── 학습 종목 목록 ─────────────────────────────
 
@@ -242,20 +264,28 @@ TOP_K_PERCENTILE    = 0.75   # 상위 25% = 1 (rank pct ≥ 0.75)
 BOTTOM_K_PERCENTILE = 0.25   # 하위 25% = 0 (rank pct ≤ 0.25), 중간 50% 제외
 # neutral zone 34%→25%: 유효 샘플 68%→75% (+10%), 극단 신호 강도 소폭 희석
 
+# cfg 키: class · params · is_ranker(선택, 날짜 그룹 랭커) · scale_features(선택, StandardScaler 적용)
+
 MODEL_CONFIGS: Dict[str, dict] = {
+    # 얕은 트리(max_depth=4) 숲은 150그루에서 AUC 가 이미 수렴 — 300그루 대비 예측 분산 차이만 남고
+    # fit 시간(Walk-Forward fold × Auto-Tune trial 마다 반복)은 절반. max_samples=0.8 은 과적합 갭 튜닝값 유지
     'random_forest': {
         'class': RandomForestClassifier,
         'params': dict(
-            n_estimators=300, max_depth=4, min_samples_split=30,
+            n_estimators=150, max_depth=4, min_samples_split=30,
             min_samples_leaf=30, max_features=0.4, max_samples=0.8,
             class_weight='balanced', random_state=42, n_jobs=-1,
         ),
     },
+    # 히스토그램 GB: 피처를 1회 255-bin 양자화 후 OpenMP 멀티스레드 히스토그램 분할
+    # (기존 GradientBoostingClassifier 는 단일 스레드 정렬 기반 exact 분할 → 학습 시간 대부분 차지)
+    # 행 subsample 미지원 → l2_regularization 으로 정규화 대체
     'gradient_boosting': {
-        'class': GradientBoostingClassifier,
+        'class': HistGradientBoostingClassifier,
         'params': dict(
-            n_estimators=200, learning_rate=0.05, max_depth=2,
-            min_samples_leaf=25, subsample=0.7, random_state=42,
+            max_iter=200, learning_rate=0.05, max_depth=2,
+            min_samples_leaf=25, l2_regularization=1.0, max_bins=255,
+            early_stopping=False, random_state=42,
         ),
     },
     'lightgbm': {
@@ -285,6 +315,9 @@ MODEL_CONFIGS: Dict[str, dict] = {
             n_estimators=200, max_depth=3, learning_rate=0.05,
             subsample=0.7, colsample_bytree=0.6, min_child_weight=25,
             reg_alpha=1.0, reg_lambda=3.0,
+            # hist 명시: sklearn 래퍼가 학습 시 QuantileDMatrix(피처 1회 양자화, float32 직접 참조)를
+            # 사용하도록 고정 — exact/approx 분할 탐색 경로로 빠지지 않음. pkl/predict 규약은 그대로
+            tree_method='hist', max_bin=256,
             random_state=42, verbosity=0,
         ),
     },
@@ -295,6 +328,37 @@ MODEL_CONFIGS: Dict[str, dict] = {
 
 MIN_STOCKS_PER_DATE = 5
 
+# 종목별 지표·피처 계산(CPU, GIL 점유) 프로세스 풀 최대 크기 — OHLCV 수집(네트워크 I/O)은 스레드 풀 유지
+_COMPUTE_MAX_WORKERS = 8
+
+# 종목별 OHLCV 수집 스레드 수 — 네트워크 대기 위주지만 Naver rate-limit 때문에 작게 유지
+_FETCH_MAX_WORKERS = 5
+
+# 모델/스케일러 pkl 압축 — 트리 배열이 잘 압축돼 RF·HGB 파일 ≈1/3, 로드 시간은 비압축과 동등 이하
+# (joblib.load 가 자동 감지 → 기존 비압축 pkl 도 그대로 로드됨)
+_MODEL_COMPRESS = ('zlib', 3)
+
+# feature_importances_ 미제공 모델(HGB)의 permutation importance 반복 횟수 (검증 세트 기준)
+_PERM_IMPORTANCE_REPEATS = 5
+
+# train_and_save 동시 학습 모델 수 (스레드) — 코어 수가 이보다 적으면 그만큼만, 1코어면 직렬
+_FIT_MAX_WORKERS = 3
+
+# 병렬 학습 시 모델 내부 스레드 수를 지정하는 파라미터명
+# (HGB 는 스레드 파라미터가 없어 OpenMP 스레드 수를 _fit_one_capped 에서 threadpoolctl 로 제한)
+_THREAD_PARAMS: Dict[str, str] = {
+    'random_forest':  'n_jobs',
+    'lightgbm':       'n_jobs',
+    'catboost':       'thread_count',
+    'xgboost_ranker': 'n_jobs',
+}
+
+# GPU 학습을 지원하는 모델 → 장치 파라미터명 (config.XGB_DEVICE 가 'cpu' 가 아닐 때만 적용)
+# hist 트리 빌드가 그대로 GPU 커널로 실행됨 — 파라미터·pkl/predict 규약 변경 없음
+_DEVICE_PARAMS: Dict[str, str] = {
+    'xgboost_ranker': 'device',
+}
+
 # ───────────────────────── Auto-Tune 설정 ─────────────────────────────────────
 
 # 모델별 랜덤 탐색 공간 (각 키=파라미터명, 값=후보값 리스트)
@@ -307,11 +371,11 @@ _AT_SEARCH_SPACES: Dict[str, Dict[str, list]] = {
         'max_samples':       [0.7, 0.8, 0.9],
     },
     'gradient_boosting': {
-        'n_estimators':     [200, 300, 400, 500],
-        'max_depth':        [2, 3, 4],
-        'learning_rate':    [0.02, 0.03, 0.05, 0.08],
-        'min_samples_leaf': [15, 20, 25, 30, 40],
-        'subsample':        [0.5, 0.6, 0.7, 0.8],
+        'max_iter':          [200, 300, 400, 500],
+        'max_depth':         [2, 3, 4],
+        'learning_rate':     [0.02, 0.03, 0.05, 0.08],
+        'min_samples_leaf':  [15, 20, 25, 30, 40],
+        'l2_regularization': [0.5, 1.0, 2.0, 5.0],
     },
     'lightgbm': {
         'max_depth':         [2, 3],
@@ -353,14 +417,14 @@ _AT_ADJUST_RULES: Dict[str, Dict[str, Dict[str, tuple]]] = {
     },
     'UNSTABLE': {
         'random_forest':     {'min_samples_leaf': ('mul', 2.0), 'min_samples_split': ('mul', 2.0)},
-        'gradient_boosting': {'min_samples_leaf': ('mul', 2.0), 'learning_rate': ('mul', 0.5), 'subsample': ('mul', 0.9)},
+        'gradient_boosting': {'min_samples_leaf': ('mul', 2.0), 'learning_rate': ('mul', 0.5), 'l2_regularization': ('mul', 2.0)},
         'lightgbm':          {'min_child_samples': ('mul', 2.0), 'reg_alpha': ('mul', 2.0), 'reg_lambda': ('mul', 2.0)},
         'catboost':          {'min_data_in_leaf': ('mul', 2.0), 'l2_leaf_reg': ('mul', 2.0)},
         'xgboost_ranker':    {'min_child_weight': ('mul', 2.0), 'reg_alpha': ('mul', 2.0), 'reg_lambda': ('mul', 2.0)},
     },
     'WEAK': {
         'random_forest':     {'min_samples_leaf': ('mul', 0.7), 'max_features': ('mul', 1.25)},
-        'gradient_boosting': {'learning_rate': ('mul', 1.5), 'subsample': ('mul', 1.1)},
+        'gradient_boosting': {'learning_rate': ('mul', 1.5), 'l2_regularization': ('mul', 0.7)},
         'lightgbm':          {'min_child_samples': ('mul', 0.7), 'reg_alpha': ('mul', 0.6), 'reg_lambda': ('mul', 0.6)},
         'catboost':          {'min_data_in_leaf': ('mul', 0.7), 'l2_leaf_reg': ('mul', 0.7)},
         'xgboost_ranker':    {'min_child_weight': ('mul', 0.7), 'colsample_bytree': ('mul', 1.1)},
@@ -369,9 +433,9 @@ _AT_ADJUST_RULES: Dict[str, Dict[str, Dict[str, tuple]]] = {
 
 # 오버라이드 저장 제외 파라미터 (환경/재현성용, 하이퍼파라미터 아님)
 _AT_SKIP_PARAMS: frozenset = frozenset({
-    'random_state', 'random_seed', 'n_jobs', 'verbosity', 'verbose',
+    'random_state', 'random_seed', 'n_jobs', 'thread_count', 'verbosity', 'verbose',
     'use_label_encoder', 'eval_metric', 'class_weight', 'auto_class_weights',
-    'bootstrap_type',
+    'bootstrap_type', 'device',
 })
 
 # 모델별 "depth" 역할 파라미터명 — 방향 제약 검사에 사용
@@ -386,6 +450,12 @@ _DEPTH_PARAMS: Dict[str, str] = {
 # Phase3 채택 기준: 원본 test_auc 대비 허용 하락폭 (이 범위 초과 하락 시 결과 거부)
 _AT_TEST_AUC_MARGIN: float = 0.005
 
+# 모델 클래스 교체로 이름이 바뀌었거나 사라진 파라미터 — 기존 override 파일 호환용
+# {모델명: {구 파라미터: 신 파라미터 | None(삭제)}}
+_LEGACY_PARAM_MAP: Dict[str, Dict[str, Optional[str]]] = {
+    'gradient_boosting': {'n_estimators': 'max_iter', 'subsample': None},
+}
+
 # ───────────────────────────── 데이터 수집 ─────────────────────────────
 
 # provider.py 의 단일 소스 구현으로 위임 (심볼 상수도 provider.MACRO_SYMBOLS 참조)
@@ -400,182 +470,373 @@ def _fetch_market_returns(symbol: str, period: str) -> pd.DataFrame:
 
 
 
-def _fetch_stock_base(
-    code: str, period: str, future_days: int,
-    min_len: int = 60,
-    market_df: pd.DataFrame = None,
-    macro_df: pd.DataFrame = None,
-) -> Optional[tuple]:
-    """공통 베이스: OHLCV 수집 → 지표 계산 → 피처 빌드 → 미래 수익률.
+def _ohlcv_cache_path(cache_dir: Path, code: str, period: str) -> Path:
+    """종목 OHLCV 디스크 캐시 경로 — (종목·기간)당 파일 1개, 수집할 때마다 덮어씀 (캐시 크기 = 종목 수)."""
+    return cache_dir / f"ohlcv_{code}_{period}.npz"
 
-    Returns
-    -------
-    (feat_valid, ret_valid, df_ind) 또는 None (데이터 부족 / 오류 시)
-        feat_valid : DataFrame — 인덱스 = feat.index[:-future_days]
-        ret_valid  : Series   — 동일 인덱스, 미래 수익률
-        df_ind     : DataFrame — indicators.calculate_all() 결과 (TCN 불필요, 참고용)
+
+def _load_ohlcv_cache(path: Path) -> Optional[pd.DataFrame]:
+    """OHLCV .npz 캐시 로드 — 없거나 당일 수집분이 아니거나 읽기 실패 시 None.
+
+    컬럼별 배열로 저장해 dtype 그대로 복원. 수집일(fetched)이 오늘이 아니면 재수집 대상.
     """
-    df = data_provider.get_ohlcv(code, period=period)
-    if df is None or df.empty or len(df) < min_len:
-        logger.warning(f"  [{code}] 데이터 부족 ({len(df) if df is not None else 0}행) — 건너뜀")
+    if not path.exists():
         return None
-    df_ind = indicators.calculate_all(df)
-    if df_ind.empty:
-        return None
-    feat = build_features(df_ind, market_df=market_df, macro_df=macro_df)
-    if len(feat) <= future_days:
+    try:
+        with np.load(path, allow_pickle=False) as z:
+            if str(z['fetched']) != datetime.now().strftime('%Y%m%d'):
+                return None
+            columns = z['columns'].tolist()
+            df = pd.DataFrame(
+                {c: z[f'c{i}'] for i, c in enumerate(columns)},
+                index=pd.DatetimeIndex(z['dates'], name='date'),
+            )
+        return df
+    except Exception as e:
+        logger.debug(f"[cache] OHLCV 캐시 로드 실패 — 재수집: {e}")
         return None
-    close      = df_ind['close'].reindex(feat.index)
-    future_ret = (close.shift(-future_days) - close) / close
-    valid_idx  = feat.index[:-future_days]
-    return feat.loc[valid_idx], future_ret.loc[valid_idx], df_ind
 
 
-def _collect_stock_features(code: str, period: str, future_days: int,
-                             market_df: pd.DataFrame = None,
-                             macro_df: pd.DataFrame = None) -> pd.DataFrame:
-    """단일 종목의 (날짜, 특성, 미래수익률) DataFrame 반환."""
+def _save_ohlcv_cache(df: pd.DataFrame, path: Path) -> None:
+    """OHLCV .npz 캐시 저장 — 숫자 컬럼만 있는 경우에만 (pickle 없이 저장 가능한 형태)."""
+    if not all(np.issubdtype(dt, np.number) for dt in df.dtypes):
+        return
     try:
-        base = _fetch_stock_base(code, period, future_days,
-                                 market_df=market_df, macro_df=macro_df)
-        if base is None:
-            return pd.DataFrame()
-        feat_valid, ret_valid, _ = base
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(
+            path,
+            fetched=np.array(datetime.now().strftime('%Y%m%d')),
+            dates=df.index.to_numpy(dtype='datetime64[ns]'),
+            columns=np.array(df.columns.tolist()),
+            **{f'c{i}': df[c].to_numpy() for i, c in enumerate(df.columns)},
+        )
+    except Exception as e:
+        logger.debug(f"[cache] OHLCV 캐시 저장 생략: {e}")
+
+
+def _fetch_stock_ohlcv(
+    code: str, period: str, min_len: int = 60, cache_dir: Optional[Path] = None,
+) -> Optional[pd.DataFrame]:
+    """OHLCV 수집 (네트워크 I/O) — 데이터 부족 시 None.
+
+    cache_dir 지정 시 당일 수집분을 .npz 로 저장·재사용 → 같은 날 재실행(--future-days 변경,
+    하이퍼파라미터 반복 조정 등)은 네트워크 수집을 건너뛰고 지표·피처 캐시로 바로 이어진다.
+    """
+    path = _ohlcv_cache_path(cache_dir, code, period) if cache_dir is not None else None
+    df   = _load_ohlcv_cache(path) if path is not None else None
+    if df is None:
+        df = data_provider.get_ohlcv(code, period=period)
+        if path is not None and df is not None and len(df) >= min_len:
+            _save_ohlcv_cache(df, path)
+    if df is None or df.empty or len(df) < min_len:
+        logger.warning(f"  [{code}] 데이터 부족 ({len(df) if df is not None else 0}행) — 건너뜀")
+        return None
+    return df
 
-        result = feat_valid.copy()
-        result['raw_return'] = ret_valid
 
-        base_subset = [c for c in BASE_FEATURE_COLS + ['raw_return'] if c in result.columns]
-        valid       = result.dropna(subset=base_subset)
-        logger.info(f"  [{code}] {len(valid)}개 샘플 수집")
-        return valid
+def _dataset_cache_path(codes: List[str], period: str, future_days: int) -> Path:
+    """학습 데이터 캐시 경로(확장자 없는 접두어) — (종목·기간·예측일·피처 목록·수집일) 해시 키.
 
-    except Exception as exc:
-        logger.error(f"  [{code}] 처리 오류: {exc}")
-        return pd.DataFrame()
+    수집일을 키에 포함해 당일 재실행(하이퍼파라미터 반복 조정 등)만 캐시를 재사용한다.
+    """
+    key_src = (
+        tuple(sorted(codes)), period, future_days,
+        tuple(BASE_FEATURE_COLS), datetime.now().strftime('%Y-%m-%d'),
+    )
+    key = hashlib.md5(repr(key_src).encode()).hexdigest()[:10]
+    return CACHE_DIR / f"train_{key}"
 
 
-def _collect_stock_tcn(code: str, period: str, future_days: int,
-                        market_df: pd.DataFrame = None,
-                        macro_df: pd.DataFrame = None) -> Optional[dict]:
-    """TCN용: 단일 종목의 전체 피처 시계열 + 이진 라벨 반환.
+def _load_frame_cache(path: Path) -> Optional[pd.DataFrame]:
+    """NumPy 바이너리 캐시 로드 — 없거나 읽기 실패 시 None.
 
-    Returns:
-        {'features': DataFrame(날짜×피처), 'raw_return': Series}
-        또는 None (데이터 부족 시)
+    피처 행렬(.X.npy, float32)은 mmap_mode='r' 로 열어 역직렬화 없이 페이지 캐시에서 바로 사용하고,
+    날짜·raw_return·컬럼명(.meta.npz)만 메모리로 읽는다.
     """
+    x_path, meta_path = path.with_suffix('.X.npy'), path.with_suffix('.meta.npz')
+    if not (x_path.exists() and meta_path.exists()):
+        return None
     try:
-        base = _fetch_stock_base(code, period, future_days,
-                                 min_len=60 + _tcn.LOOKBACK,
-                                 market_df=market_df, macro_df=macro_df)
-        if base is None:
-            return None
-        feat_valid, ret_valid, _ = base
-
-        if len(feat_valid) <= _tcn.LOOKBACK:
-            return None
-
-        feat_cols  = [c for c in BASE_FEATURE_COLS if c in feat_valid.columns]
-        feat_clean = feat_valid[feat_cols].dropna()
-        ret_align  = ret_valid.reindex(feat_clean.index).dropna()
-        feat_clean = feat_clean.reindex(ret_align.index)
-
-        if len(ret_align) < 30:
-            return None
-
-        # 크로스섹셔널 라벨은 fetch_train_test_samples 가 처리하므로
-        # 여기서는 raw_return만 담아 반환 → 호출 측에서 rank 기반 라벨 변환
-        return {'features': feat_clean, 'raw_return': ret_align}
-
-    except Exception as exc:
-        logger.error(f"  [{code}] TCN 수집 오류: {exc}")
+        X = np.load(x_path, mmap_mode='r')
+        with np.load(meta_path, allow_pickle=False) as meta:
+            index      = pd.DatetimeIndex(meta['dates'])
+            columns    = meta['columns'].tolist()
+            raw_return = meta['raw_return']
+        df = pd.DataFrame(X, index=index, columns=columns, copy=False)
+        df['raw_return'] = raw_return
+        logger.info(f"[cache] 학습 데이터 캐시 사용: {path.name} ({len(df)}행)")
+        return df
+    except Exception as e:
+        logger.warning(f"[cache] 캐시 로드 실패 — 재수집합니다: {e}")
         return None
 
 
-def fetch_train_test_samples(
-    codes: List[str], period: str, future_days: int, test_ratio: float = 0.2
-) -> Tuple[pd.DataFrame, pd.DataFrame, dict]:
-    """크로스섹셔널 상대 강도 순위를 타깃으로 하는 학습/검증 세트 수집.
+def _save_frame_cache(df: pd.DataFrame, path: Path) -> None:
+    """NumPy 바이너리 캐시 저장 (.X.npy 피처 행렬 + .meta.npz) — 실패 시 경고만 남기고 계속.
 
-    Returns:
-        (df_train, df_test, tcn_stock_data)
-        tcn_stock_data: {code: {'features': DataFrame, 'labels': Series}} — TCN 학습용
+    메타 파일을 마지막에 기록 → 메타가 존재하면 피처 행렬 기록도 완료된 상태.
     """
-    market_df = _fetch_market_returns('KS11', period)
-    if market_df.empty:
-        logger.warning("KS11 시장 데이터 미수신 — rs_vs_mkt 피처는 0으로 채워집니다.")
-        market_df = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        feat_cols = [c for c in df.columns if c != 'raw_return']
+        np.save(path.with_suffix('.X.npy'), df[feat_cols].to_numpy(dtype=np.float32))
+        np.savez(
+            path.with_suffix('.meta.npz'),
+            dates=df.index.to_numpy(dtype='datetime64[ns]'),
+            columns=np.array(feat_cols),
+            raw_return=df['raw_return'].to_numpy(dtype=np.float64),
+        )
+        logger.info(f"[cache] 학습 데이터 캐시 저장: {path}")
+    except Exception as e:
+        logger.warning(f"[cache] 캐시 저장 실패: {e}")
 
-    logger.info("[거시경제] VIX·S&P500 데이터 수집 중...")
-    macro_df = _fetch_macro_data(period)
-    if macro_df.empty:
-        macro_df = None
 
+def _xs_rank_pct(
+    dates: pd.Index, values: np.ndarray, date_codes: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """날짜별 크로스섹셔널 백분위 순위 (0~1].
+
+    ``pd.Series(values).groupby(dates).rank(pct=True)`` 와 동일한 결과(동점은 평균 순위,
+    NaN 은 순위 계산에서 제외 후 NaN 유지)를 groupby 디스패치 없이 단일
+    ``np.lexsort`` (날짜 코드, 값) 정렬로 계산한다.
+    date_codes: 호출 측에서 이미 구한 ``pd.factorize(dates)[0]`` — 전달 시 재계산 생략.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out    = np.full(len(values), np.nan)
+    valid  = ~np.isnan(values)
+    if not valid.any():
+        return out
+    if date_codes is None:
+        date_codes = pd.factorize(dates)[0]
+    codes = date_codes[valid]
+    vals  = values[valid]
+    order = np.lexsort((vals, codes))
+    g, v  = codes[order], vals[order]
+
+    pos       = np.arange(len(v))
+    new_group = np.r_[True, g[1:] != g[:-1]]
+    ordinal   = pos - np.maximum.accumulate(np.where(new_group, pos, 0)) + 1   # 그룹 내 1-based 순번
+    # 동점 구간(같은 날짜 · 같은 값) → 평균 순위
+    new_run  = new_group | np.r_[True, v[1:] != v[:-1]]
+    run_id   = np.cumsum(new_run) - 1
+    run_rank = ordinal[new_run] + (np.bincount(run_id) - 1) / 2.0
+
+    ranked        = np.empty(len(v))
+    ranked[order] = run_rank[run_id] / np.bincount(g)[g]
+    out[valid]    = ranked
+    return out
+
+
+def _collect_stock_samples(
+    codes: List[str], period: str, future_days: int,
+    want_tree: bool, tcn_lookback: Optional[int],
+    ind_cache_dir: Optional[Path] = None, ohlcv_cache_dir: Optional[Path] = None,
+) -> Tuple[list, dict]:
+    """시장·거시 데이터 + 종목별 OHLCV 수집 → 종목별 트리 샘플 / TCN 시계열 계산.
+
+    Returns:
+        (frames, tcn_raw)
+        frames : 종목별 트리 샘플 DataFrame 리스트 (want_tree=False 이면 빈 리스트)
+        tcn_raw: {code: {'features': DataFrame, 'raw_return': Series}} (tcn_lookback=None 이면 빈 dict)
+    """
     # ── 소켓 타임아웃 설정 ────────────────────────────────────────────────
     # FDR DataReader는 내부적으로 소켓을 사용. 전역 소켓 타임아웃을 30초로 설정해
     # Naver rate-limit으로 응답 없는 연결이 영구 hang하는 현상 방지.
     _prev_timeout = socket.getdefaulttimeout()
     socket.setdefaulttimeout(30)
 
-    logger.info(f"  종목 {len(codes)}개 병렬 수집 중 (max_workers=5, socket_timeout=30s)...")
-    frames = []
-    tcn_raw: dict = {}   # {code: {'features': df, 'raw_return': series}}
-    executor = ThreadPoolExecutor(max_workers=5)
+    # 종목 OHLCV 수집은 시장·거시 데이터와 무관 → 먼저 제출해 아래 시장·거시 수집과 겹쳐 진행
+    # (시장·거시 프레임은 계산 단계에서만 필요)
+    fetch_pool = ThreadPoolExecutor(max_workers=_FETCH_MAX_WORKERS)
     try:
-        # 트리 모델용 + TCN용 동시 수집 (같은 데이터, 다른 형태)
-        tree_futures = {
-            executor.submit(_collect_stock_features, c, period, future_days, market_df, macro_df): ('tree', c)
+        fetch_futures = {
+            fetch_pool.submit(_fetch_stock_ohlcv, c, period, cache_dir=ohlcv_cache_dir): c
             for c in codes
         }
-        tcn_futures = {
-            executor.submit(_collect_stock_tcn, c, period, future_days, market_df, macro_df): ('tcn', c)
-            for c in codes
-        } if _tcn.is_available() else {}
 
-        all_futures = {**tree_futures, **tcn_futures}
+        # 시장 지수(FDR)와 거시경제(yfinance) 수집은 서로 독립적인 네트워크 I/O → 동시 실행
+        logger.info("[시장·거시경제] KS11 · VIX·S&P500 데이터 동시 수집 중...")
+        with ThreadPoolExecutor(max_workers=2) as ctx_pool:
+            market_fut = ctx_pool.submit(_fetch_market_returns, 'KS11', period)
+            macro_fut  = ctx_pool.submit(_fetch_macro_data, period)
+            market_df  = market_fut.result()
+            macro_df   = macro_fut.result()
+
+        if market_df.empty:
+            logger.warning("KS11 시장 데이터 미수신 — rs_vs_mkt 피처는 0으로 채워집니다.")
+            market_df = None
+        if macro_df.empty:
+            macro_df = None
+
+        # OHLCV 수집(네트워크 I/O)은 스레드 풀, 지표·피처 계산(CPU, GIL 점유)은 프로세스 풀로 분리.
+        # 수집이 끝난 종목부터 계산 작업을 제출 → 수집과 계산이 겹쳐 진행됨.
+        # spawn 컨텍스트: 서버 등 멀티스레드 프로세스에서 fork 시 락 상속 교착 방지
+        # 워커 함수는 samples.py 에 있음 → 워커는 모델 라이브러리·torch 없이 지표·피처 모듈만 import
+        n_compute = min(os.cpu_count() or 1, _COMPUTE_MAX_WORKERS, len(codes))
+        logger.info(
+            f"  종목 {len(codes)}개 병렬 수집 중 "
+            f"(수집 스레드={_FETCH_MAX_WORKERS}, 계산 프로세스={n_compute}, socket_timeout=30s)..."
+        )
+        frames = []
+        tcn_raw: dict = {}   # {code: {'features': df, 'raw_return': series}}
+        compute_pool = (
+            ProcessPoolExecutor(
+                max_workers=n_compute,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=init_worker,
+                initargs=(market_df, macro_df, ind_cache_dir),
+            ) if n_compute > 1 else None
+        )
+        compute_futures: dict = {}   # {future: (code, ohlcv_df)}
+
+        def _collect_result(c: str, tree_df: pd.DataFrame, tcn_data: Optional[dict]) -> None:
+            if not tree_df.empty:
+                frames.append(tree_df)
+                logger.info(f"  [{c}] {len(tree_df)}개 샘플 수집")
+            if tcn_data is not None:
+                tcn_raw[c] = tcn_data
+
+        def _compute_inline(c: str, df: pd.DataFrame) -> None:
+            try:
+                _collect_result(c, *stock_samples(
+                    df, future_days, market_df, macro_df, want_tree, tcn_lookback, ind_cache_dir, c,
+                ))
+            except Exception as exc:
+                logger.error(f"  [{c}] 처리 오류: {exc}")
+
         # per-call timeout은 provider.get_ohlcv 내부에서 25s 강제됨.
         # 여기서는 전체 수집에 걸리는 시간을 보수적으로 제한 (종목수 × 1.5배 마진).
-        n_futures = len(all_futures)
-        outer_timeout = max(300, n_futures * 3)   # 최소 5분, 최대 종목당 3s 기대
+        outer_timeout = max(300, len(fetch_futures) * 3)   # 최소 5분, 최대 종목당 3s 기대
         try:
-            for fut in as_completed(all_futures, timeout=outer_timeout):
-                kind, c = all_futures[fut]
+            for fut in as_completed(fetch_futures, timeout=outer_timeout):
+                c = fetch_futures[fut]
                 try:
-                    result = fut.result()
-                    if kind == 'tree':
-                        if result is not None and not result.empty:
-                            frames.append(result)
-                    else:
-                        if result is not None:
-                            tcn_raw[c] = result
+                    df = fut.result()
                 except Exception as e:
-                    logger.error(f"  [{c}/{kind}] 병렬 수집 오류: {e}")
+                    logger.error(f"  [{c}] 병렬 수집 오류: {e}")
+                    continue
+                if df is None:
+                    continue
+                if compute_pool is None:
+                    _compute_inline(c, df)
+                else:
+                    compute_futures[compute_pool.submit(
+                        stock_samples_worker, df, future_days, want_tree, tcn_lookback, c,
+                    )] = (c, df)
         except _FuturesTimeout:
-            done_codes = [all_futures[f] for f in all_futures if f.done()]
-            hung_codes = [all_futures[f] for f in all_futures if not f.done()]
+            done_codes = [fetch_futures[f] for f in fetch_futures if f.done()]
+            hung_codes = [fetch_futures[f] for f in fetch_futures if not f.done()]
             logger.warning(
-                f"  ⚠️  수집 타임아웃: {len(done_codes)}/{len(all_futures)}개 완료 "
+                f"  ⚠️  수집 타임아웃: {len(done_codes)}/{len(fetch_futures)}개 완료 "
                 f"— 미완료 {len(hung_codes)}개 건너뜀"
             )
     finally:
-        executor.shutdown(wait=False)
+        fetch_pool.shutdown(wait=False)
         socket.setdefaulttimeout(_prev_timeout)
 
-    df_all = pd.concat(frames)
+    if compute_pool is not None:
+        # 계산 대기도 수집과 같은 전체 제한 시간 적용 — 응답 없는 워커가 학습 전체를 무기한 멈추지 않도록
+        timed_out = False
+        try:
+            for fut in as_completed(compute_futures, timeout=outer_timeout):
+                c, df = compute_futures[fut]
+                try:
+                    _collect_result(c, *fut.result())
+                except BrokenProcessPool:
+                    # 워커 프로세스 비정상 종료(메모리 부족 등) → 해당 종목은 현재 프로세스에서 계산
+                    _compute_inline(c, df)
+                except Exception as exc:
+                    logger.error(f"  [{c}] 처리 오류: {exc}")
+        except _FuturesTimeout:
+            timed_out  = True
+            hung_codes = [c for f, (c, _) in compute_futures.items() if not f.done()]
+            logger.warning(
+                f"  ⚠️  계산 타임아웃: {len(compute_futures) - len(hung_codes)}/{len(compute_futures)}개 완료 "
+                f"— 미완료 {len(hung_codes)}개 건너뜀 ({', '.join(hung_codes[:10])})"
+            )
+        finally:
+            if not timed_out:
+                compute_pool.shutdown(wait=True)
+            else:
+                # 대기 중 작업은 취소하고 멈춘 워커 프로세스는 종료 — 남겨 두면 인터프리터 종료 시
+                # 풀 join 에서 다시 멈춤 (terminate_workers 는 Python 3.14+, 이전 버전은 프로세스 직접 종료)
+                terminate = getattr(compute_pool, 'terminate_workers', None)
+                if terminate is not None:
+                    terminate()
+                else:
+                    procs = list((getattr(compute_pool, '_processes', None) or {}).values())
+                    compute_pool.shutdown(wait=False, cancel_futures=True)
+                    for proc in procs:
+                        proc.terminate()
+
+    return frames, tcn_raw
+
+
+def fetch_train_test_samples(
+    codes: List[str], period: str, future_days: int, test_ratio: float = 0.2,
+    use_cache: bool = False,
+) -> Tuple[pd.DataFrame, pd.DataFrame, dict]:
+    """크로스섹셔널 상대 강도 순위를 타깃으로 하는 학습/검증 세트 수집.
+
+    use_cache: True이면 트리 모델용 종목 피처 프레임을 CACHE_DIR 에 NumPy 바이너리로 저장하고,
+               같은 날 동일 조건 재실행 시 종목별 수집·지표 계산을 건너뛴다 (TCN 데이터는 재수집).
+               종목별 지표·피처 계산 결과도 CACHE_DIR/indicators 에 종목당 파일 1개씩 캐시한다
+               (입력 해시가 같으면 재사용, 바뀌면 재계산 후 덮어씀).
+               종목 OHLCV 도 당일 수집분을 CACHE_DIR/ohlcv 에 저장해 같은 날 재실행 시 재다운로드 생략.
+
+    Returns:
+        (df_train, df_test, tcn_stock_data)
+        tcn_stock_data: {code: {'features': DataFrame, 'labels': Series}} — TCN 학습용
+    """
+    cache_path      = _dataset_cache_path(codes, period, future_days) if use_cache else None
+    ind_cache_dir   = CACHE_DIR / "indicators" if use_cache else None
+    ohlcv_cache_dir = CACHE_DIR / "ohlcv" if use_cache else None
+    df_cached       = _load_frame_cache(cache_path) if cache_path is not None else None
+
+    # 트리 모델용 + TCN용 동시 수집 (같은 데이터, 다른 형태) — 종목당 작업 1개
+    want_tree    = df_cached is None
+    want_tcn     = _tcn.is_available()
+    tcn_lookback = _tcn.LOOKBACK if want_tcn else None
+    run_codes    = codes if (want_tree or want_tcn) else []
+
+    if run_codes:
+        frames, tcn_raw = _collect_stock_samples(
+            run_codes, period, future_days, want_tree, tcn_lookback, ind_cache_dir, ohlcv_cache_dir,
+        )
+    else:
+        # 데이터셋 캐시 적중 + TCN 미사용 → 시장·거시·종목 수집이 필요 없음
+        logger.info("[cache] 학습 데이터 캐시 사용 — 시장·거시·종목 데이터 수집 생략")
+        frames, tcn_raw = [], {}
+
+    if df_cached is not None:
+        df_all = df_cached
+    else:
+        # 종목 프레임은 모두 같은 블록 구성(float32 피처 블록 + float64 raw_return) → pd.concat 이
+        # 블록 단위로 바로 이어붙임. 사전 할당 NumPy 버퍼에 종목별 열 선택·복사하는 방식보다 빠름
+        # (200종목×470행 기준 concat ≈11ms vs 버퍼 ≈51ms) — 열 단위 재조립으로 바꾸지 말 것
+        df_all = pd.concat(frames)
+        frames.clear()   # 종목별 프레임 즉시 해제 — 결합본과 원본이 함께 상주하는 구간 최소화
+        if cache_path is not None:
+            _save_frame_cache(df_all, cache_path)
 
     # 이진 타깃 (중립 구간 제거): 상위 25% = 1, 하위 25% = 0, 중간 50% 제외
-    rank_pct = df_all.groupby(df_all.index)['raw_return'].rank(pct=True)
-    df_all['target'] = np.nan
-    df_all.loc[rank_pct >= TOP_K_PERCENTILE,    'target'] = 1
-    df_all.loc[rank_pct <= BOTTOM_K_PERCENTILE, 'target'] = 0
-    df_all = df_all.dropna(subset=['target'])
-    df_all['target'] = df_all['target'].astype(int)
-
-    stocks_per_date = df_all.groupby(df_all.index)['raw_return'].count()
-    valid_dates     = stocks_per_date[stocks_per_date >= MIN_STOCKS_PER_DATE].index
-    df_all          = df_all[df_all.index.isin(valid_dates)]
-
-    all_dates  = sorted(df_all.index.unique())
+    # 라벨 마스크 + 날짜별 라벨 종목 수 필터를 하나의 행 마스크로 합쳐 전체 프레임을 한 번만 복사
+    # (NaN 타깃 열 생성 → .loc 2회 → dropna → isin 필터로 이어지던 전체 프레임 패스 제거)
+    # 날짜 인코딩은 한 번만 — 순위 계산·날짜별 종목 수·분할 마스크가 같은 date_codes 공유
+    date_codes, date_uniques = pd.factorize(df_all.index)
+    rank_pct = _xs_rank_pct(df_all.index, df_all['raw_return'].to_numpy(), date_codes)
+    labeled  = (rank_pct >= TOP_K_PERCENTILE) | (rank_pct <= BOTTOM_K_PERCENTILE)
+    stocks_per_date = pd.Series(
+        np.bincount(date_codes[labeled], minlength=len(date_uniques)), index=date_uniques,
+    )
+    valid_dates = stocks_per_date.index[stocks_per_date >= MIN_STOCKS_PER_DATE]
+    keep        = labeled & (stocks_per_date.to_numpy()[date_codes] >= MIN_STOCKS_PER_DATE)
+    # 타깃 열은 전체 행에 붙이고(keep 밖 행은 아래 분할 마스크에서 제외) 필터·분할을 한 번의 행 선택으로 결합
+    # → keep 적용 중간 프레임(전체 열 복사) 없이 train/test 를 각각 한 번씩만 복사
+    df_all['target'] = (rank_pct >= TOP_K_PERCENTILE).astype(int)
+
+    # 유효 날짜 = keep 행이 존재하는 날짜 (라벨 종목 수 ≥ MIN_STOCKS_PER_DATE 인 날짜)
+    all_dates  = valid_dates.sort_values()
     n_dates    = len(all_dates)
     split_idx  = min(int(n_dates * (1.0 - test_ratio)), n_dates - 1)
     split_date = all_dates[split_idx]
@@ -587,11 +848,16 @@ def fetch_train_test_samples(
     purge_idx  = max(0, split_idx - 2 * future_days)
     purge_date = all_dates[purge_idx]
 
-    keep_cols = [c for c in BASE_FEATURE_COLS if c in df_all.columns] + ['target']
-    df_train  = df_all[df_all.index <  purge_date][keep_cols].dropna()
-    df_test   = df_all[df_all.index >= split_date][keep_cols].dropna()
+    # 행 마스크(keep ∧ 날짜 구간)와 열 선택을 .loc 한 번에 적용 — 날짜 비교는 고유 날짜 배열에서 한 번만
+    # 하고 date_codes 로 행에 펼침. 분할 후 df_all 은 해제해 학습 중 상주 메모리를 train/test 로 한정
+    keep_cols  = [c for c in BASE_FEATURE_COLS if c in df_all.columns] + ['target']
+    is_train   = keep & (date_uniques <  purge_date)[date_codes]
+    is_test    = keep & (date_uniques >= split_date)[date_codes]
+    df_train   = df_all.loc[is_train, keep_cols].dropna()
+    df_test    = df_all.loc[is_test,  keep_cols].dropna()
+    del df_all
 
-    purged_n = len(df_all[(df_all.index >= purge_date) & (df_all.index < split_date)])
+    purged_n = int((keep & ((date_uniques >= purge_date) & (date_uniques < split_date))[date_codes]).sum())
     logger.info(
         f"[Purging] 학습/테스트 경계 제거: {purge_date.date()} ~ {split_date.date()} "
         f"({future_days}거래일 gap) → {purged_n}샘플 제거"
@@ -610,31 +876,27 @@ def fetch_train_test_samples(
     # ── TCN용: 크로스섹셔널 rank 기반 이진 라벨 생성 ──────────────────────
     tcn_stock_data: dict = {}
     if tcn_raw:
-        # 전체 종목의 raw_return을 날짜별로 합산해 rank 계산
-        combined = {}
-        for code, d in tcn_raw.items():
-            for dt, rv in d['raw_return'].items():
-                combined.setdefault(dt, {})[code] = rv
-        # 날짜별 rank → 종목별 이진 라벨 Series 생성
-        code_labels: dict = {}
-        for dt, code_ret in combined.items():
-            if len(code_ret) < MIN_STOCKS_PER_DATE:
-                continue
-            rets   = pd.Series(code_ret)
-            ranks  = rets.rank(pct=True)
-            for code, rp in ranks.items():
-                if rp >= TOP_K_PERCENTILE:
-                    code_labels.setdefault(code, {})[dt] = 1
-                elif rp <= BOTTOM_K_PERCENTILE:
-                    code_labels.setdefault(code, {})[dt] = 0
-                # 중립 구간은 라벨 없음 (TCN build_sequences 가 자동 제외)
-
-        for code, lbl_dict in code_labels.items():
-            if code in tcn_raw:
-                tcn_stock_data[code] = {
-                    'features': tcn_raw[code]['features'],
-                    'labels':   pd.Series(lbl_dict),
-                }
+        # 전체 종목의 raw_return을 (code, date) long 시리즈로 결합 → 날짜별 rank 를 한 번에 계산
+        # (종목×날짜 중첩 Python 루프 + 날짜별 Series.rank 호출 제거)
+        long_ret = pd.concat(
+            {code: d['raw_return'] for code, d in tcn_raw.items()}, names=['code', 'date'],
+        )
+        dates      = long_ret.index.get_level_values('date')
+        date_codes = pd.factorize(dates)[0]
+        n_per_date = np.bincount(date_codes)[date_codes]
+        ranks      = _xs_rank_pct(dates, long_ret.to_numpy(), date_codes)
+        # 중립 구간은 라벨 없음 (TCN build_sequences 가 자동 제외)
+        labeled    = (n_per_date >= MIN_STOCKS_PER_DATE) & (
+            (ranks >= TOP_K_PERCENTILE) | (ranks <= BOTTOM_K_PERCENTILE)
+        )
+        labels = pd.Series(
+            (ranks[labeled] >= TOP_K_PERCENTILE).astype(int), index=long_ret.index[labeled],
+        )
+        for code, lbl in labels.groupby(level='code', sort=False):
+            tcn_stock_data[code] = {
+                'features': tcn_raw[code]['features'],
+                'labels':   lbl.droplevel('code'),
+            }
         logger.info(f"[TCN] 라벨 생성 완료: {len(tcn_stock_data)}개 종목")
 
     return df_train, df_test, tcn_stock_data
@@ -654,6 +916,12 @@ def _load_effective_configs() -> Dict[str, dict]:
             try:
                 with open(_override_path, encoding="utf-8") as _f:
                     _ov = json.load(_f)
+                for _old, _new in _LEGACY_PARAM_MAP.get(_name, {}).items():
+                    if _old in _ov:
+                        _val = _ov.pop(_old)
+                        if _new is not None:
+                            _ov.setdefault(_new, _val)
+                        logger.info(f"[override] {_name} 구버전 파라미터 변환: {_old} → {_new or '삭제'}")
                 _merged['params'].update(_ov)
                 logger.info(f"[override] {_name} 파라미터 오버라이드 적용: {_ov}")
             except Exception as _e:
@@ -662,63 +930,168 @@ def _load_effective_configs() -> Dict[str, dict]:
     return effective
 
 
-def _walk_forward_cv(
-    df_train: pd.DataFrame,
-    feat_names: List[str],
+def _to_tree_input(X: np.ndarray) -> np.ndarray:
+    """트리 모델 입력 행렬 → float32 · Fortran-order(열 우선) 연속 배열.
+
+    sklearn 트리 빌더는 분할 탐색 시 float32 열 단위로 스캔하므로, 미리 변환해 두면
+    fit 내부의 float64 → float32 복사가 생략되고 스캔 대역폭이 절반으로 줄어든다.
+    XGBoost · LightGBM · CatBoost 도 float32 입력을 그대로 수용한다.
+    """
+    return np.asfortranarray(X, dtype=np.float32)
+
+
+def _make_scaler(cfg: dict) -> Any:
+    """모델 설정별 스케일러 — cfg['scale_features'] 가 True 인 모델만 StandardScaler.
+
+    트리 모델은 분할이 피처 순서에만 의존(단조 변환 불변) → 표준화는 이득 없이 행렬 2패스 + 복사만 추가.
+    기본은 항등 변환기(FunctionTransformer, 입력 배열을 복사 없이 그대로 반환)를 사용하고,
+    스케일에 민감한 모델(선형 등)을 추가할 때만 MODEL_CONFIGS 에 scale_features=True 로 지정한다.
+    모델-스케일러 쌍 저장 규약은 어느 경우든 유지 (구버전 pkl 의 StandardScaler 도 그대로 로드됨).
+    """
+    return StandardScaler() if cfg.get('scale_features', False) else FunctionTransformer()
+
+
+def _scaled_inputs(
     cfg: dict,
     X_train: np.ndarray,
-    y_train: np.ndarray,
+    X_test: np.ndarray,
+    prepared: Optional[dict] = None,
+) -> Tuple[Any, np.ndarray, np.ndarray]:
+    """(scaler, X_tr, X_te) — 최종 학습용 전처리 행렬 (scaler 적합 + 트리 입력 변환).
+
+    결과는 스케일링 방식(scale_features)에만 의존 → prepared dict 가 주어지면 방식별로 1회만 계산해
+    모델 간(및 Auto-Tune Phase3 재학습) 공유. 항등 변환기 모델들이 각자 만들던 F-order 복사본도 1개로 줄어듦.
+    """
+    key = bool(cfg.get('scale_features', False))
+    if prepared is not None and key in prepared:
+        return prepared[key]
+    scaler = _make_scaler(cfg)
+    result = (
+        scaler,
+        _to_tree_input(scaler.fit_transform(X_train)),
+        _to_tree_input(scaler.transform(X_test)),
+    )
+    if prepared is not None:
+        prepared[key] = result
+    return result
+
+
+def _date_groups(dates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """랭커 입력용 (날짜 오름차순 안정 정렬 순서, 날짜별 그룹 크기).
+
+    DataFrame.sort_index() + groupby(index).size() 를 대체 — 프레임 전체 복사·groupby 디스패치 없이
+    정렬 인덱스만 구해 X/y 배열을 한 번에 재배열한다.
+    """
+    order    = np.argsort(dates, kind='stable')
+    _, sizes = np.unique(dates[order], return_counts=True)
+    return order, sizes
+
+
+def _cv_folds(
+    train_dates: pd.Index,
     unique_dates: list,
     future_days: int,
-) -> Tuple[List[float], List[float]]:
-    """Walk-Forward CV (롤링 윈도우, Purging 적용) → (cv_aucs, oof_preds).
+) -> List[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+    """Walk-Forward CV fold 계획 → [(tr_idx, val_idx, rank_tr_idx, rank_groups), ...].
 
     검증 윈도우: 20거래일(≈1개월), 스텝: 10거래일 (overlapping)
     최소 학습 기간: max(전체 날짜 60%, 120일) — 초반 fold AUC 신뢰도 확보
     VAL_STEP=10: fold 수 2배(≈24→48) — CV AUC 신뢰도 향상 (Purging으로 leakage 방지)
+
+    fold 구성은 날짜에만 의존 → 학습 1회당 한 번 만들어 모든 모델·Auto-Tune trial 이 공유.
+    rank_tr_idx / rank_groups: 랭커용 날짜 오름차순 재배열 학습 인덱스 · 날짜별 그룹 크기.
     """
     VAL_WINDOW  = 20
     VAL_STEP    = 10
     min_train_n = max(int(len(unique_dates) * 0.6), 120)
-    is_ranker   = cfg.get('is_ranker', False)
-    cv_aucs:   List[float] = []
-    oof_preds: List[float] = []
+    # 각 샘플의 날짜 → unique_dates 내 정수 위치 (1회 계산)
+    # fold 마다 Timestamp 집합을 만들어 isin 해싱하는 대신 정수 범위 비교로 마스크 생성
+    date_pos  = pd.DatetimeIndex(unique_dates).get_indexer(train_dates)
+    folds     = []
     start_idx = min_train_n
     while start_idx + VAL_WINDOW <= len(unique_dates):
         end_idx        = min(start_idx + VAL_WINDOW, len(unique_dates))
         purge_boundary = start_idx - 2 * future_days
-        tr_dates_set   = {unique_dates[i] for i in range(max(0, purge_boundary))}
-        val_dates_set  = {unique_dates[i] for i in range(start_idx, end_idx)}
-        tr_mask  = df_train.index.isin(tr_dates_set)
-        val_mask = df_train.index.isin(val_dates_set)
-        if tr_mask.sum() < 10 or val_mask.sum() < 10:
-            start_idx += VAL_STEP
-            continue
+        tr_idx  = np.flatnonzero(date_pos < max(0, purge_boundary))
+        val_idx = np.flatnonzero((date_pos >= start_idx) & (date_pos < end_idx))
+        if len(tr_idx) >= 10 and len(val_idx) >= 10:
+            tr_order, groups = _date_groups(date_pos[tr_idx])
+            folds.append((tr_idx, val_idx, tr_idx[tr_order], groups))
+        start_idx += VAL_STEP
+    return folds
+
+
+def _walk_forward_cv(
+    df_train: pd.DataFrame,
+    feat_names: List[str],
+    cfg: dict,
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    unique_dates: list,
+    future_days: int,
+    folds: Optional[list] = None,
+) -> Tuple[List[float], List[float]]:
+    """Walk-Forward CV (롤링 윈도우, Purging 적용) → (cv_aucs, oof_preds).
+
+    folds: _cv_folds 결과 (None 이면 여기서 계산) — fold 구성은 _cv_folds 참조.
+    """
+    if folds is None:
+        folds = _cv_folds(df_train.index, unique_dates, future_days)
+    is_ranker = cfg.get('is_ranker', False)
+    cv_aucs:   List[float] = []
+    oof_preds: List[float] = []
+    for tr_idx, val_idx, rank_tr_idx, g_cv_tr in folds:
         if is_ranker:
-            fold_tr  = df_train[tr_mask].sort_index()
-            fold_val = df_train[val_mask].sort_index()
-            cv_sc    = StandardScaler()
+            # 예측만 수행하는 검증 구간은 정렬 불필요
+            cv_sc    = _make_scaler(cfg)
             cv_m     = cfg['class'](**cfg['params'])
-            X_cv_tr  = cv_sc.fit_transform(fold_tr[feat_names].values)
-            X_cv_val = cv_sc.transform(fold_val[feat_names].values)
-            g_cv_tr  = fold_tr.groupby(fold_tr.index).size().values
-            cv_m.fit(X_cv_tr, fold_tr['target'].values, group=g_cv_tr)
+            X_cv_tr  = _to_tree_input(cv_sc.fit_transform(X_train[rank_tr_idx]))
+            X_cv_val = _to_tree_input(cv_sc.transform(X_train[val_idx]))
+            cv_m.fit(X_cv_tr, y_train[rank_tr_idx], group=g_cv_tr)
             cv_scores = cv_m.predict(X_cv_val)
             oof_preds.extend(cv_scores.tolist())
-            cv_aucs.append(roc_auc_score(fold_val['target'].values, cv_scores))
+            cv_aucs.append(roc_auc_score(y_train[val_idx], cv_scores))
         else:
-            cv_sc    = StandardScaler()
+            cv_sc    = _make_scaler(cfg)
             cv_m     = cfg['class'](**cfg['params'])
-            X_cv_tr  = pd.DataFrame(cv_sc.fit_transform(X_train[tr_mask]), columns=feat_names)
-            X_cv_val = pd.DataFrame(cv_sc.transform(X_train[val_mask]),    columns=feat_names)
-            cv_m.fit(X_cv_tr, y_train[tr_mask])
+            X_cv_tr  = pd.DataFrame(_to_tree_input(cv_sc.fit_transform(X_train[tr_idx])),
+                                    columns=feat_names, copy=False)
+            X_cv_val = pd.DataFrame(_to_tree_input(cv_sc.transform(X_train[val_idx])),
+                                    columns=feat_names, copy=False)
+            cv_m.fit(X_cv_tr, y_train[tr_idx])
             cv_p = cv_m.predict_proba(X_cv_val)[:, 1]
             oof_preds.extend(cv_p.tolist())
-            cv_aucs.append(roc_auc_score(y_train[val_mask], cv_p))
-        start_idx += VAL_STEP
+            cv_aucs.append(roc_auc_score(y_train[val_idx], cv_p))
     return cv_aucs, oof_preds
 
 
+def _model_feature_importances(
+    model: Any, n_features: int, X_val: Any = None, y_val: Optional[np.ndarray] = None,
+) -> Optional[np.ndarray]:
+    """피처 중요도 배열 (합=1) — 계산할 수 없으면 None.
+
+    feature_importances_ 를 제공하지 않는 모델(HistGradientBoostingClassifier)은 검증 세트에서
+    sklearn.inspection.permutation_importance (피처별 셔플 시 AUC 감소량, 음수는 0)로 대체 —
+    비공개 트리 내부 구조에 의존하지 않아 sklearn 버전이 바뀌어도 동작한다.
+    """
+    if hasattr(model, 'feature_importances_'):
+        imp = np.asarray(model.feature_importances_, dtype=float)
+        return imp if len(imp) == n_features else None
+    if X_val is None or y_val is None:
+        return None
+    try:
+        result = permutation_importance(
+            model, X_val, y_val, scoring='roc_auc',
+            n_repeats=_PERM_IMPORTANCE_REPEATS, random_state=42,
+        )
+        imp   = np.clip(result.importances_mean, 0.0, None)
+        total = imp.sum()
+        return imp / total if total > 0 else imp
+    except Exception as e:
+        logger.debug(f"피처 중요도 계산 생략: {e}")
+        return None
+
+
 def _train_final_model(
     cfg: dict,
     feat_names: List[str],
@@ -729,36 +1102,38 @@ def _train_final_model(
     df_train: pd.DataFrame,
     oof_preds: List[float],
     t0: float,
-) -> Tuple[Any, StandardScaler, float, float, float, List[float], list]:
+    prepared: Optional[dict] = None,
+) -> Tuple[Any, Any, float, float, float, List[float], list]:
     """최종 모델 학습(전체 학습 세트) 및 평가.
 
+    prepared: _scaled_inputs 공유 캐시 (None 이면 이 모델에서 직접 scaler 적합).
+
     Returns
     -------
     (model, scaler, train_auc, test_auc, test_logloss, calibration_points,
      feature_importances, duration)
     """
-    scaler    = StandardScaler()
+    # 트리 모델: 항등 변환기 — scaler 적합은 행 순서와 무관하므로 랭커도 공유 행렬을 재배열해 사용
+    scaler, X_tr_arr, X_te_arr = _scaled_inputs(cfg, X_train, X_test, prepared)
     is_ranker = cfg.get('is_ranker', False)
     if is_ranker:
-        df_tr_sorted = df_train.sort_index()
-        g_tr         = df_tr_sorted.groupby(df_tr_sorted.index).size().values
-        X_tr  = scaler.fit_transform(df_tr_sorted[feat_names].values)
-        X_te  = scaler.transform(X_test)
+        tr_order, g_tr = _date_groups(df_train.index.to_numpy())
+        y_tr  = y_train[tr_order]
+        X_tr  = _to_tree_input(X_tr_arr[tr_order])
+        X_te  = X_te_arr
         model = cfg['class'](**cfg['params'])
-        model.fit(X_tr, df_tr_sorted['target'].values, group=g_tr)
+        model.fit(X_tr, y_tr, group=g_tr)
         duration     = time.time() - t0
         train_scores = model.predict(X_tr)
         test_scores  = model.predict(X_te)
         _cal_src = oof_preds if len(oof_preds) >= 101 else train_scores.tolist()
         calibration_points = np.percentile(_cal_src, np.arange(0, 101)).tolist()
-        train_auc    = roc_auc_score(df_tr_sorted['target'].values, train_scores)
+        train_auc    = roc_auc_score(y_tr, train_scores)
         test_auc     = roc_auc_score(y_test, test_scores)
         test_logloss = float('nan')
     else:
-        X_tr_arr = scaler.fit_transform(X_train)
-        X_te_arr = scaler.transform(X_test)
-        X_tr  = pd.DataFrame(X_tr_arr, columns=feat_names)
-        X_te  = pd.DataFrame(X_te_arr, columns=feat_names)
+        X_tr  = pd.DataFrame(X_tr_arr, columns=feat_names, copy=False)
+        X_te  = pd.DataFrame(X_te_arr, columns=feat_names, copy=False)
         model = cfg['class'](**cfg['params'])
         model.fit(X_tr, y_train)
         duration     = time.time() - t0
@@ -771,9 +1146,10 @@ def _train_final_model(
         test_logloss = log_loss(y_test, test_proba)
 
     feature_importances: list = []
-    if hasattr(model, 'feature_importances_') and len(feat_names) == len(model.feature_importances_):
+    importances = _model_feature_importances(model, len(feat_names), X_te, y_test)
+    if importances is not None:
         fi_pairs = sorted(
-            zip(feat_names, model.feature_importances_.tolist()),
+            zip(feat_names, importances.tolist()),
             key=lambda x: x[1], reverse=True,
         )
         feature_importances = [[n, round(v, 6)] for n, v in fi_pairs]
@@ -845,6 +1221,7 @@ def _auto_tune_model(
     future_days: int,
     current_metrics: dict,
     max_trials: int = 15,
+    folds: Optional[list] = None,
 ) -> Tuple[Optional[dict], dict]:
     """Phase 1 (규칙 기반) + Phase 2 (랜덤 탐색) Auto-Tune.
 
@@ -902,17 +1279,32 @@ def _auto_tune_model(
                 f"`train --reset-overrides` 후 재시도를 권장합니다."
             )
 
+    # 동일 파라미터 조합의 CV 재실행 방지 (이산 탐색 공간 → Phase2 trial 중복 빈번,
+    # 규칙이 적용되지 않으면 Phase1 = 기본 파라미터). 기본 파라미터 CV 는 호출측에서 이미 계산됨.
+    def _params_key(params: dict) -> str:
+        return json.dumps(params, sort_keys=True, default=str)
+
+    cv_memo: Dict[str, float] = {}
+    if not np.isnan(cv_mean):
+        cv_memo[_params_key(base_params)] = cv_mean
+
     def _cv_score(candidate_params: dict) -> float:
+        key = _params_key(candidate_params)
+        if key in cv_memo:
+            logger.debug(f"  [auto-tune] {name}: 중복 파라미터 — CV 재사용 ({cv_memo[key]:.4f})")
+            return cv_memo[key]
         cand_cfg = copy.deepcopy(cfg)
         cand_cfg['params'] = candidate_params
         try:
             cv_aucs, _ = _walk_forward_cv(
-                df_train, feat_names, cand_cfg, X_train, y_train, unique_dates, future_days
+                df_train, feat_names, cand_cfg, X_train, y_train, unique_dates, future_days, folds,
             )
-            return float(np.mean(cv_aucs)) if cv_aucs else 0.0
+            score = float(np.mean(cv_aucs)) if cv_aucs else 0.0
         except Exception as e:
             logger.debug(f"  [auto-tune] CV 오류 ({name}): {e}")
-            return 0.0
+            score = 0.0
+        cv_memo[key] = score
+        return score
 
     # ── Phase 1: 규칙 기반 조정 ────────────────────────────────────────────
     p1_params = _at_apply_rules(name, base_params, diagnosis)
@@ -969,6 +1361,126 @@ def _auto_tune_model(
     return best_cfg, tune_log
 
 
+def _fit_one(
+    name: str,
+    cfg: dict,
+    df_train: pd.DataFrame,
+    feat_names: List[str],
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_test: np.ndarray,
+    y_test: np.ndarray,
+    unique_dates: list,
+    future_days: int,
+    auto_tune: bool,
+    max_trials: int,
+    save_overrides: bool,
+    prepared: Optional[dict] = None,
+    folds: Optional[list] = None,
+) -> dict:
+    """단일 모델 CV → 최종 학습 → (선택) Auto-Tune 수행 후 결과 dict 반환.
+
+    로그 출력·아티팩트 저장은 호출자(train_and_save)가 모델 순서대로 수행 —
+    여러 모델을 동시에 학습해도 저장 파일·요약 로그 순서는 직렬 실행과 동일.
+    """
+    logger.info(f"  학습 중: {name}")
+    t0 = time.time()
+
+    # ── Walk-Forward CV ───────────────────────────────────────────────
+    if folds is None:
+        folds = _cv_folds(df_train.index, unique_dates, future_days)
+    cv_aucs, oof_preds = _walk_forward_cv(
+        df_train, feat_names, cfg, X_train, y_train, unique_dates, future_days, folds,
+    )
+    cv_mean = float(np.mean(cv_aucs)) if cv_aucs else float('nan')
+    cv_std  = float(np.std(cv_aucs))  if cv_aucs else float('nan')
+
+    # ── 최종 모델 학습 ────────────────────────────────────────────────
+    model, scaler, train_auc, test_auc, test_logloss, calibration_points, \
+        feature_importances, duration = _train_final_model(
+            cfg, feat_names, X_train, y_train, X_test, y_test, df_train, oof_preds, t0, prepared,
+        )
+    overfit_gap  = round(train_auc - test_auc, 4)
+    quality_pass = bool(test_auc >= MIN_MODEL_AUC)
+
+    # ── Auto-Tune Phase 1+2 (CV 탐색) + Phase 3 (전체 재학습) ───────────
+    tune_log: Optional[dict] = None
+    if auto_tune:
+        current_metrics = {
+            'test_auc': test_auc, 'train_auc': train_auc,
+            'cv_mean': cv_mean,   'cv_std':    cv_std,
+        }
+        best_at_cfg, tune_log = _auto_tune_model(
+            name, cfg, df_train, feat_names,
+            X_train, y_train, unique_dates, future_days,
+            current_metrics, max_trials, folds,
+        )
+        if best_at_cfg is not None and tune_log.get('improvement', 0) > 0.001:
+            logger.info(f"  [auto-tune] Phase3: {name} 최적 파라미터로 전체 재학습 중...")
+            # 원본 모델 아티팩트 보관 (test AUC guard 실패 시 복원)
+            _at_orig = dict(
+                model=model, scaler=scaler,
+                test_auc=test_auc, train_auc=train_auc,
+                test_logloss=test_logloss,
+                calibration_points=calibration_points,
+                feature_importances=feature_importances,
+                duration=duration,
+                overfit_gap=overfit_gap,
+                quality_pass=quality_pass,
+            )
+            t0_at = time.time()
+            model, scaler, train_auc, test_auc, test_logloss, calibration_points, \
+                feature_importances, duration = _train_final_model(
+                    best_at_cfg, feat_names, X_train, y_train, X_test, y_test,
+                    df_train, oof_preds, t0_at, prepared,
+                )
+            overfit_gap  = round(train_auc - test_auc, 4)
+            quality_pass = bool(test_auc >= MIN_MODEL_AUC)
+            # Test AUC guard: 원본 대비 허용 하락폭 초과 시 Phase3 결과 거부
+            if test_auc >= _at_orig['test_auc'] - _AT_TEST_AUC_MARGIN:
+                logger.info(
+                    f"  [auto-tune] Phase3 채택: test_auc "
+                    f"{_at_orig['test_auc']:.4f} → {test_auc:.4f}  "
+                    f"gap={overfit_gap:.4f}  {'✅' if quality_pass else '⚠️'}"
+                )
+                if save_overrides:
+                    _at_write_overrides(name, best_at_cfg['params'], MODEL_CONFIGS[name]['params'])
+                cfg = best_at_cfg   # meta 저장 시 실제 사용 파라미터 반영
+                tune_log['accepted'] = True
+            else:
+                logger.warning(
+                    f"  [auto-tune] Phase3 거부: test_auc 하락 "
+                    f"{_at_orig['test_auc']:.4f} → {test_auc:.4f} "
+                    f"(허용 하락폭 {_AT_TEST_AUC_MARGIN}) — 원본 파라미터 유지"
+                )
+                model, scaler         = _at_orig['model'], _at_orig['scaler']
+                test_auc, train_auc   = _at_orig['test_auc'], _at_orig['train_auc']
+                test_logloss          = _at_orig['test_logloss']
+                calibration_points    = _at_orig['calibration_points']
+                feature_importances   = _at_orig['feature_importances']
+                duration              = _at_orig['duration']
+                overfit_gap           = _at_orig['overfit_gap']
+                quality_pass          = _at_orig['quality_pass']
+                tune_log['accepted']  = False
+
+    return dict(
+        cfg=cfg, cv_aucs=cv_aucs, cv_mean=cv_mean, cv_std=cv_std,
+        model=model, scaler=scaler, train_auc=train_auc, test_auc=test_auc,
+        test_logloss=test_logloss, calibration_points=calibration_points,
+        feature_importances=feature_importances, duration=duration,
+        overfit_gap=overfit_gap, quality_pass=quality_pass, tune_log=tune_log,
+    )
+
+
+def _fit_one_capped(n_threads: int, name: str, cfg: dict, *fit_args) -> dict:
+    """스레드 파라미터가 없는 모델(HGB — OpenMP)용 _fit_one — 이 학습 스레드의 OpenMP 스레드 수를 제한.
+
+    OpenMP 스레드 수 설정은 호출 스레드 단위라 동시에 학습 중인 다른 모델에는 영향이 없다.
+    """
+    with threadpool_limits(limits=n_threads, user_api='openmp'):
+        return _fit_one(name, cfg, *fit_args)
+
+
 def train_and_save(df_train: pd.DataFrame, df_test: pd.DataFrame,
                    future_days: int = 10,
                    tcn_stock_data: Optional[dict] = None,
@@ -993,14 +1505,16 @@ def train_and_save(df_train: pd.DataFrame, df_test: pd.DataFrame,
     if len(feat_names) < len(BASE_FEATURE_COLS):
         missing = [c for c in BASE_FEATURE_COLS if c not in df_train.columns]
         logger.warning(f"누락 피처 {len(missing)}개 — 학습에서 제외됩니다: {missing}")
-    X_train = df_train[feat_names].values
+    # 피처 행렬은 float32 로 고정 — build_features/캐시가 이미 float32 이면 변환 없이 통과하고,
+    # 이후 스케일러·CV fold 슬라이스·트리 입력 변환이 모두 절반 폭으로 동작 (타깃은 0/1 정수 유지)
+    X_train = df_train[feat_names].to_numpy(dtype=np.float32)
     y_train = df_train['target'].values
 
     if df_test.empty:
         logger.warning("검증 세트가 없습니다. 학습 세트 성능만 기록됩니다.")
         X_test, y_test = X_train, y_train
     else:
-        X_test = df_test[feat_names].values
+        X_test = df_test[feat_names].to_numpy(dtype=np.float32)
         y_test = df_test['target'].values
 
     pos_rate     = y_train.mean()
@@ -1010,92 +1524,70 @@ def train_and_save(df_train: pd.DataFrame, df_test: pd.DataFrame,
 
     effective_configs = _load_effective_configs()
 
+    # ── 모델 학습 (스레드 병렬) ──────────────────────────────────────────
+    # 트리 라이브러리 fit 은 GIL 을 해제하므로 스레드로 충분 — 학습 배열을 프로세스마다 복사하지 않음.
+    # 모델 내부 스레드 수는 코어/동시 학습 수로 제한해 과구독 방지 (HGB OpenMP 는 프로세스 전역 설정)
+    n_cpu = os.cpu_count() or 1
+    n_fit = min(_FIT_MAX_WORKERS, n_cpu, len(effective_configs))
+    # 최종 학습 입력(scaler 적합·float32 F-order 변환)은 스케일링 방식별로 여기서 1회만 준비 →
+    # 스레드들은 읽기만 하므로 공유 dict 에 잠금 불필요
+    prepared: dict = {}
+    for cfg in effective_configs.values():
+        _scaled_inputs(cfg, X_train, X_test, prepared)
+    if config.XGB_DEVICE != 'cpu':
+        for name, cfg in effective_configs.items():
+            if name in _DEVICE_PARAMS:
+                cfg['params'][_DEVICE_PARAMS[name]] = config.XGB_DEVICE
+                logger.info(f"  [{name}] 학습 장치: {config.XGB_DEVICE}")
+    # Walk-Forward fold 구성(날짜 마스크·랭커 정렬 순서)도 모델·Auto-Tune trial 공통 → 1회만 계산
+    folds    = _cv_folds(df_train.index, unique_dates, future_days)
+    fit_args = (df_train, feat_names, X_train, y_train, X_test, y_test,
+                unique_dates, future_days, auto_tune, max_trials, save_overrides, prepared, folds)
+    # 모델당 스레드 수는 병렬 학습 중에만 적용 → 저장 전 설정값(미설정이면 라이브러리 기본값)으로 복원
+    configured_threads: Dict[str, Any] = {}
+    if n_fit > 1:
+        n_inner = max(1, n_cpu // n_fit)
+        for name, cfg in effective_configs.items():
+            if name in _THREAD_PARAMS:
+                param = _THREAD_PARAMS[name]
+                configured_threads[name] = (
+                    cfg['params'][param] if param in cfg['params']
+                    else cfg['class']().get_params().get(param)
+                )
+                cfg['params'][param] = n_inner
+        logger.info(f"모델 {len(effective_configs)}개 병렬 학습 (동시 {n_fit}개, 모델당 스레드 {n_inner})")
+        with ThreadPoolExecutor(max_workers=n_fit) as executor:
+            futures = {
+                name: (executor.submit(_fit_one, name, cfg, *fit_args) if name in _THREAD_PARAMS
+                       else executor.submit(_fit_one_capped, n_inner, name, cfg, *fit_args))
+                for name, cfg in effective_configs.items()
+            }
+            fitted = {name: fut.result() for name, fut in futures.items()}
+    else:
+        fitted = {name: _fit_one(name, cfg, *fit_args)
+                  for name, cfg in effective_configs.items()}
+
     results = []
-    for name, cfg in effective_configs.items():
-        logger.info(f"{'─'*40}")
-        logger.info(f"  학습 중: {name}")
-        t0 = time.time()
+    for name, fit in fitted.items():
+        cfg                 = fit['cfg']
+        cv_mean, cv_std     = fit['cv_mean'], fit['cv_std']
+        model, scaler       = fit['model'], fit['scaler']
+        train_auc, test_auc = fit['train_auc'], fit['test_auc']
+        test_logloss        = fit['test_logloss']
+        calibration_points  = fit['calibration_points']
+        feature_importances = fit['feature_importances']
+        duration            = fit['duration']
+        overfit_gap         = fit['overfit_gap']
+        quality_pass        = fit['quality_pass']
+        tune_log            = fit['tune_log']
 
-        # ── Walk-Forward CV ───────────────────────────────────────────────
-        cv_aucs, oof_preds = _walk_forward_cv(
-            df_train, feat_names, cfg, X_train, y_train, unique_dates, future_days
-        )
-        n_folds = len(cv_aucs)
-        cv_mean = float(np.mean(cv_aucs)) if cv_aucs else float('nan')
-        cv_std  = float(np.std(cv_aucs))  if cv_aucs else float('nan')
+        logger.info(f"{'─'*40}")
+        logger.info(f"  학습 결과: {name}")
+        n_folds = len(fit['cv_aucs'])
         if not (np.isnan(cv_mean) or np.isnan(cv_std)):
             logger.info(f"  CV AUC (Walk-Forward, {n_folds} folds, purged): {cv_mean:.4f} ± {cv_std:.4f}")
         else:
             logger.warning("  CV AUC (Walk-Forward): N/A (유효 fold 없음)")
-
-        # ── 최종 모델 학습 ────────────────────────────────────────────────
-        model, scaler, train_auc, test_auc, test_logloss, calibration_points, \
-            feature_importances, duration = _train_final_model(
-                cfg, feat_names, X_train, y_train, X_test, y_test, df_train, oof_preds, t0
-            )
-        overfit_gap  = round(train_auc - test_auc, 4)
-        quality_pass = bool(test_auc >= MIN_MODEL_AUC)
-
-        # ── Auto-Tune Phase 1+2 (CV 탐색) + Phase 3 (전체 재학습) ───────────
-        tune_log: Optional[dict] = None
-        if auto_tune:
-            current_metrics = {
-                'test_auc': test_auc, 'train_auc': train_auc,
-                'cv_mean': cv_mean,   'cv_std':    cv_std,
-            }
-            best_at_cfg, tune_log = _auto_tune_model(
-                name, cfg, df_train, feat_names,
-                X_train, y_train, unique_dates, future_days,
-                current_metrics, max_trials,
-            )
-            if best_at_cfg is not None and tune_log.get('improvement', 0) > 0.001:
-                logger.info(f"  [auto-tune] Phase3: {name} 최적 파라미터로 전체 재학습 중...")
-                # 원본 모델 아티팩트 보관 (test AUC guard 실패 시 복원)
-                _at_orig = dict(
-                    model=model, scaler=scaler,
-                    test_auc=test_auc, train_auc=train_auc,
-                    test_logloss=test_logloss,
-                    calibration_points=calibration_points,
-                    feature_importances=feature_importances,
-                    duration=duration,
-                    overfit_gap=overfit_gap,
-                    quality_pass=quality_pass,
-                )
-                t0_at = time.time()
-                model, scaler, train_auc, test_auc, test_logloss, calibration_points, \
-                    feature_importances, duration = _train_final_model(
-                        best_at_cfg, feat_names, X_train, y_train, X_test, y_test,
-                        df_train, oof_preds, t0_at,
-                    )
-                overfit_gap  = round(train_auc - test_auc, 4)
-                quality_pass = bool(test_auc >= MIN_MODEL_AUC)
-                # Test AUC guard: 원본 대비 허용 하락폭 초과 시 Phase3 결과 거부
-                if test_auc >= _at_orig['test_auc'] - _AT_TEST_AUC_MARGIN:
-                    logger.info(
-                        f"  [auto-tune] Phase3 채택: test_auc "
-                        f"{_at_orig['test_auc']:.4f} → {test_auc:.4f}  "
-                        f"gap={overfit_gap:.4f}  {'✅' if quality_pass else '⚠️'}"
-                    )
-                    if save_overrides:
-                        _at_write_overrides(name, best_at_cfg['params'], MODEL_CONFIGS[name]['params'])
-                    cfg = best_at_cfg   # meta 저장 시 실제 사용 파라미터 반영
-                    tune_log['accepted'] = True
-                else:
-                    logger.warning(
-                        f"  [auto-tune] Phase3 거부: test_auc 하락 "
-                        f"{_at_orig['test_auc']:.4f} → {test_auc:.4f} "
-                        f"(허용 하락폭 {_AT_TEST_AUC_MARGIN}) — 원본 파라미터 유지"
-                    )
-                    model, scaler         = _at_orig['model'], _at_orig['scaler']
-                    test_auc, train_auc   = _at_orig['test_auc'], _at_orig['train_auc']
-                    test_logloss          = _at_orig['test_logloss']
-                    calibration_points    = _at_orig['calibration_points']
-                    feature_importances   = _at_orig['feature_importances']
-                    duration              = _at_orig['duration']
-                    overfit_gap           = _at_orig['overfit_gap']
-                    quality_pass          = _at_orig['quality_pass']
-                    tune_log['accepted']  = False
-
         logger.info(f"  AUC : {test_auc:.4f}  (학습 AUC: {train_auc:.4f}  과적합 gap: {overfit_gap:.4f})")
         if not np.isnan(test_logloss):
             logger.info(f"  LogLoss: {test_logloss:.4f}")
@@ -1114,8 +1606,15 @@ def train_and_save(df_train: pd.DataFrame, df_test: pd.DataFrame,
         # ── 아티팩트 저장 ─────────────────────────────────────────────────
         model_path  = MODEL_DIR / f"{name}_model.pkl"
         scaler_path = MODEL_DIR / f"{name}_scaler.pkl"
-        joblib.dump(model,  model_path)
-        joblib.dump(scaler, scaler_path)
+        if name in _DEVICE_PARAMS and cfg['params'].get(_DEVICE_PARAMS[name], 'cpu') != 'cpu':
+            # GPU 학습 모델도 추론(prediction_model)은 CPU 전용 환경에서 수행 → 장치를 되돌려 저장
+            model.set_params(**{_DEVICE_PARAMS[name]: 'cpu'})
+        if name in configured_threads and not isinstance(model, CatBoostClassifier):
+            # 학습용 n_jobs 가 pkl 에 남으면 예측 서비스가 그 스레드 수로 추론 → 설정값으로 되돌려 저장
+            # (CatBoost 는 학습 후 파라미터 변경 불가 · predict_proba 가 자체 thread_count 인자를 사용)
+            model.set_params(**{_THREAD_PARAMS[name]: configured_threads[name]})
+        joblib.dump(model,  model_path,  compress=_MODEL_COMPRESS)
+        joblib.dump(scaler, scaler_path, compress=_MODEL_COMPRESS)
         logger.info(f"  저장: {model_path}")
         logger.info(f"  저장: {scaler_path}")
 
@@ -1123,8 +1622,8 @@ def train_and_save(df_train: pd.DataFrame, df_test: pd.DataFrame,
         version  = f"{name}_v{saved_at.strftime('%Y%m%d_%H%M%S')}"
         meta = {
             "parameters":          {k: v for k, v in cfg['params'].items()
-                                    if k not in ('random_state', 'n_jobs', 'verbosity',
-                                                 'use_label_encoder', 'eval_metric')},
+                                    if k not in ('random_state', 'n_jobs', 'thread_count', 'device',
+                                                 'verbosity', 'use_label_encoder', 'eval_metric')},
             "model_type":          "ranker" if cfg.get('is_ranker') else "binary_classifier",
             "target_definition":   (
                 f"top {int((1-TOP_K_PERCENTILE)*100)}% / "
@@ -1216,6 +1715,7 @@ def run_training(
     max_trials: int = 15,
     save_overrides: bool = True,
     reset_overrides: bool = False,
+    use_cache: bool = False,
 ) -> None:
     """koreanstocks train 명령어 및 train_models.py 양쪽에서 호출하는 진입점.
 
@@ -1228,6 +1728,7 @@ def run_training(
         max_trials:      Phase2 랜덤 탐색 시도 횟수
         save_overrides:  True이면 채택 파라미터를 overrides.json 에 저장
         reset_overrides: True이면 학습 전 모든 overrides.json 삭제 (기본 MODEL_CONFIGS 복원)
+        use_cache:       True이면 당일 수집한 학습 데이터를 CACHE_DIR 에 캐시·재사용
     """
     if stocks is None:
         stocks = DEFAULT_TRAINING_STOCKS
@@ -1255,6 +1756,10 @@ def run_training(
     logger.info(f"  검증 비율   : {test_ratio * 100:.0f}% (시계열 후반부)")
     logger.info(f"  타깃 변수   : {future_days}거래일 후 수익률 상위 25%/하위 25% 이진 분류 (중간 50% 제외, AUC-ROC)")
     logger.info(f"  피처 수     : {len(BASE_FEATURE_COLS)}개 (기술적+TA+거시경제)")
+    if _SKLEARNEX_OK:
+        logger.info("  RF 가속     : sklearnex (oneDAL)")
+    elif config.USE_SKLEARNEX:
+        logger.warning("  RF 가속     : KOREANSTOCKS_USE_SKLEARNEX 설정됐지만 sklearnex 미설치 — sklearn 사용")
     if auto_tune:
         logger.info(f"  Auto-Tune   : 활성화 (max_trials={max_trials}, save_overrides={save_overrides})")
     logger.info("=" * 40)
@@ -1262,6 +1767,7 @@ def run_training(
     logger.info("\n[1/2] 학습 데이터 수집 중...")
     df_train, df_test, tcn_stock_data = fetch_train_test_samples(
         stocks, period=period, future_days=future_days, test_ratio=test_ratio,
+        use_cache=use_cache,
     )
 
     logger.info("\n[2/2] 모델 학습 및 저장 중...")
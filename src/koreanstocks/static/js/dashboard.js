@@ -2063,7 +2063,7 @@ function _buildImprovements(models, ensemble) {
       if (m.name === "random_forest") {
         actionText = "trainer.py RF 파라미터: max_depth 추가 축소(4→3) 또는 max_samples 0.8→0.7 강화 후 재학습. 효과 미미 시 ExtraTreesClassifier 교체 검토.";
       } else if (m.name === "gradient_boosting") {
-        actionText = "trainer.py GB: max_depth 2→1 또는 min_samples_leaf 25→40, subsample 0.7→0.6 강화 후 재학습.";
+        actionText = "trainer.py GB: max_depth 2→1 또는 min_samples_leaf 25→40, l2_regularization 1.0→2.0 강화 후 재학습.";
       } else if (m.name === "catboost") {
         actionText = "trainer.py CB: depth 3→2 또는 l2_leaf_reg 5→10 강화 후 재학습.";
       } else {
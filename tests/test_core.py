@@ -143,6 +143,28 @@ class TestBuildFeatures:
         result = build_features(df_with_indicators)
         assert not result.empty
 
+    def test_output_dtype_is_float32(self):
+        """build_features() 피처 컬럼은 float32 로 반환되어야 함 (학습 메모리 절감)."""
+        from koreanstocks.core.engine.features import build_features
+        from koreanstocks.core.engine.indicators import indicators
+
+        df = _make_ohlcv(150)
+        result = build_features(indicators.calculate_all(df))
+        assert (result.dtypes == np.float32).all()
+
+    def test_macro_missing_values_use_neutral_defaults(self):
+        """거시 데이터 미커버 구간·누락 심볼은 중립값(VIX=20, 금리=4 등)으로 채워져야 함."""
+        from koreanstocks.core.engine.features import build_features
+        from koreanstocks.core.engine.indicators import indicators
+
+        df_ind = indicators.calculate_all(_make_ohlcv(150))
+        macro  = pd.DataFrame({'vix_level': 30.0}, index=df_ind.index[-20:])
+        result = build_features(df_ind, macro_df=macro)
+        assert (result['tnx_level'] == 4.0).all() and (result['csi300_1m'] == 0.0).all()
+        covered = result.index.isin(macro.index)
+        assert (result.loc[covered, 'vix_level'] == 30.0).all()
+        assert (result.loc[~covered, 'vix_level'] == 20.0).all()
+
     def test_output_values_are_finite_or_nan(self):
         """build_features() 결과 값이 inf 를 포함하지 않아야 함."""
         from koreanstocks.core.engine.features import build_features, BASE_FEATURE_COLS
@@ -157,6 +179,13 @@ class TestBuildFeatures:
                 assert not np.isinf(result[col].dropna()).any(), \
                     f"{col} 컬럼에 inf 값이 있습니다."
 
+    def test_ffill_matches_pandas(self):
+        """_ffill() 은 Series.ffill() 과 동일해야 함 (선두 NaN 유지, 중간 NaN 채움)."""
+        from koreanstocks.core.engine.features import _ffill
+
+        x = np.array([np.nan, 1.0, np.nan, np.nan, 2.5, np.nan, 3.0])
+        np.testing.assert_array_equal(_ffill(x), pd.Series(x).ffill().to_numpy())
+
 
 # ─────────────────────────────────────────────────────────────────
 # indicators.py — get_composite_score() 범위 검증
@@ -239,3 +268,184 @@ class TestCalcRoeAvg:
         from koreanstocks.core.data.fundamental_provider import calc_roe_avg
         result = calc_roe_avg({"roe": 10.333, "roe_prev": 20.777})
         assert result == pytest.approx(round((10.333 + 20.777) / 2, 1))
+
+
+# ─────────────────────────────────────────────────────────────────
+# trainer.py — _xs_rank_pct (날짜별 크로스섹셔널 순위)
+# ─────────────────────────────────────────────────────────────────
+
+class TestXsRankPct:
+    def _dates_values(self):
+        rng = np.random.default_rng(0)
+        dates = pd.DatetimeIndex(rng.choice(pd.date_range("2024-01-01", periods=20), 400))
+        values = rng.integers(0, 10, 400).astype(float)   # 동점 다수 포함
+        values[::23] = np.nan
+        return dates, values
+
+    def test_matches_pandas_groupby_rank(self):
+        """pandas groupby(date).rank(pct=True) 와 동일 (동점 평균 순위 · NaN 유지)."""
+        from koreanstocks.core.engine.trainer import _xs_rank_pct
+        dates, values = self._dates_values()
+        expected = pd.Series(values, index=dates).groupby(level=0).rank(pct=True).to_numpy()
+        np.testing.assert_allclose(_xs_rank_pct(dates, values), expected, equal_nan=True)
+        # 미리 구한 날짜 코드 전달 시에도 동일
+        codes = pd.factorize(dates)[0]
+        np.testing.assert_allclose(_xs_rank_pct(dates, values, codes), expected, equal_nan=True)
+
+    def test_range_is_0_to_1(self):
+        from koreanstocks.core.engine.trainer import _xs_rank_pct
+        dates, values = self._dates_values()
+        result = _xs_rank_pct(dates, values)
+        finite = result[~np.isnan(result)]
+        assert finite.min() > 0.0 and finite.max() == pytest.approx(1.0)
+
+
+# ─────────────────────────────────────────────────────────────────
+# trainer.py — _make_scaler (모델-스케일러 쌍 규약)
+# ─────────────────────────────────────────────────────────────────
+
+class TestMakeScaler:
+    def test_tree_models_get_identity_scaler(self):
+        """기본 MODEL_CONFIGS(트리 모델)는 입력을 복사 없이 그대로 반환하는 스케일러."""
+        from koreanstocks.core.engine.trainer import MODEL_CONFIGS, _make_scaler
+        X = np.random.default_rng(0).normal(size=(50, 4)).astype(np.float32)
+        for cfg in MODEL_CONFIGS.values():
+            scaler = _make_scaler(cfg)
+            assert scaler.fit_transform(X) is X
+            assert scaler.transform(X) is X
+
+    def test_scale_features_uses_standard_scaler(self):
+        from sklearn.preprocessing import StandardScaler
+        from koreanstocks.core.engine.trainer import _make_scaler
+        assert isinstance(_make_scaler({'scale_features': True}), StandardScaler)
+
+    def test_prediction_model_detects_identity_scaler(self):
+        """추론 측은 학습 측 항등 변환기를 인식해 변환을 생략 (StandardScaler 는 그대로 적용)."""
+        from koreanstocks.core.engine.trainer import _make_scaler
+        from koreanstocks.core.engine.prediction_model import _is_identity_scaler
+        assert _is_identity_scaler(_make_scaler({}))
+        assert not _is_identity_scaler(_make_scaler({'scale_features': True}))
+
+
+# ─────────────────────────────────────────────────────────────────
+# prediction_model.py — _FlatForest (RF 평탄화 추론기)
+# ─────────────────────────────────────────────────────────────────
+
+class TestFlatForest:
+    def test_matches_sklearn_predict_proba(self):
+        """평탄화 추론 결과가 sklearn RandomForestClassifier.predict_proba 와 비트 단위로 일치."""
+        from sklearn.ensemble import RandomForestClassifier
+        from koreanstocks.core.engine.prediction_model import _FlatForest
+        rng = np.random.default_rng(0)
+        X = rng.normal(size=(600, 6)).astype(np.float32)
+        y = (X[:, 0] + rng.normal(size=600) > 0).astype(int)
+        rf = RandomForestClassifier(
+            n_estimators=20, max_depth=4, class_weight='balanced', random_state=0,
+        ).fit(X, y)
+        X_new = np.vstack([X[:5], rng.normal(size=(20, 6)).astype(np.float32)])
+        np.testing.assert_array_equal(_FlatForest(rf).predict_proba(X_new), rf.predict_proba(X_new))
+
+    def test_feature_names_are_validated(self):
+        """피처 이름이 학습 시와 같으면 평탄화 경로, 순서가 바뀌면 sklearn 과 동일하게 오류."""
+        from sklearn.ensemble import RandomForestClassifier
+        from koreanstocks.core.engine.prediction_model import _FlatForest
+        rng = np.random.default_rng(1)
+        cols = ["a", "b", "c"]
+        X = pd.DataFrame(rng.normal(size=(300, 3)).astype(np.float32), columns=cols)
+        y = (X["a"] > 0).astype(int)
+        rf = RandomForestClassifier(n_estimators=10, max_depth=3, random_state=0).fit(X, y)
+        flat = _FlatForest(rf)
+        np.testing.assert_array_equal(flat.predict_proba(X.iloc[:5]), rf.predict_proba(X.iloc[:5]))
+        with pytest.raises(ValueError):
+            flat.predict_proba(X.iloc[:5][["b", "a", "c"]])
+
+
+# ─────────────────────────────────────────────────────────────────
+# trainer.py — OHLCV 디스크 캐시 (종목·기간당 슬롯 1개)
+# ─────────────────────────────────────────────────────────────────
+
+class TestOhlcvCache:
+    def test_single_slot_per_code_and_period(self, tmp_path):
+        """재저장 시 같은 파일을 덮어쓰고, 수집일이 오늘이 아니면 캐시 미스."""
+        from koreanstocks.core.engine.trainer import (
+            _load_ohlcv_cache, _ohlcv_cache_path, _save_ohlcv_cache,
+        )
+        df = _make_ohlcv(80)
+        path = _ohlcv_cache_path(tmp_path, "005930", "2y")
+        _save_ohlcv_cache(df, path)
+        _save_ohlcv_cache(df, path)
+        assert [p.name for p in tmp_path.iterdir()] == [path.name]
+        pd.testing.assert_frame_equal(_load_ohlcv_cache(path), df, check_names=False, check_freq=False)
+
+        with np.load(path) as z:
+            stale = {k: z[k] for k in z.files}
+        stale['fetched'] = np.array("19990101")
+        np.savez(path, **stale)
+        assert _load_ohlcv_cache(path) is None
+
+
+# ─────────────────────────────────────────────────────────────────
+# samples.py — 종목별 지표·피처 디스크 캐시 (종목당 슬롯 1개)
+# ─────────────────────────────────────────────────────────────────
+
+class TestStockCacheSlots:
+    def test_indicator_cache_overwrites_slot_on_new_bar(self, tmp_path):
+        """새 거래일이 붙어 OHLCV 가 바뀌면 재계산 후 같은 슬롯을 덮어씀 (파일 수 = 종목 수)."""
+        from koreanstocks.core.engine.indicators import indicators
+        from koreanstocks.core.engine.samples import calculate_indicators
+        df = _make_ohlcv(150)
+        for n in (149, 150, 150):
+            result = calculate_indicators(df.iloc[:n], tmp_path, "005930")
+            pd.testing.assert_frame_equal(
+                result, indicators.calculate_all(df.iloc[:n]),
+                check_dtype=False, check_freq=False, check_names=False,
+            )
+        assert [p.name for p in tmp_path.iterdir()] == ["ind_005930.npz"]
+
+    def test_feature_cache_overwrites_slot_when_inputs_change(self, tmp_path):
+        """시장 데이터 등 입력이 바뀌면 재계산 후 같은 슬롯을 덮어쓰고, 같은 입력은 캐시에서 복원."""
+        from koreanstocks.core.engine.features import build_features
+        from koreanstocks.core.engine.indicators import indicators
+        from koreanstocks.core.engine.samples import build_features_cached
+        df_ind = indicators.calculate_all(_make_ohlcv(150))
+        market = pd.DataFrame({"return_1m": 0.01, "return_3m": 0.02}, index=df_ind.index)
+        for mkt in (None, market, market):
+            result = build_features_cached(df_ind, market_df=mkt, cache_dir=tmp_path, code="005930")
+            pd.testing.assert_frame_equal(
+                result, build_features(df_ind, market_df=mkt), check_freq=False, check_names=False,
+            )
+        assert [p.name for p in tmp_path.iterdir()] == ["feat_005930.npz"]
+
+
+# ─────────────────────────────────────────────────────────────────
+# trainer.py — fetch_train_test_samples (데이터셋 캐시 적중 경로)
+# ─────────────────────────────────────────────────────────────────
+
+class TestFetchTrainTestSamplesCache:
+    def test_cache_hit_without_tcn_skips_all_fetching(self, tmp_path, monkeypatch):
+        """캐시 적중 + TCN 미사용이면 시장·거시·종목 데이터를 전혀 수집하지 않고 분할만 수행."""
+        from koreanstocks.core.engine import trainer
+        from koreanstocks.core.engine.features import BASE_FEATURE_COLS
+
+        def _no_fetch(*args, **kwargs):
+            raise AssertionError("캐시 적중 시 수집 호출 금지")
+
+        monkeypatch.setattr(trainer, "CACHE_DIR", tmp_path)
+        monkeypatch.setattr(trainer._tcn, "is_available", lambda: False)
+        for fn in ("_fetch_market_returns", "_fetch_macro_data", "_fetch_stock_ohlcv"):
+            monkeypatch.setattr(trainer, fn, _no_fetch)
+
+        rng   = np.random.default_rng(0)
+        codes = [f"{i:06d}" for i in range(12)]
+        dates = pd.bdate_range("2024-01-01", periods=60)
+        index = pd.DatetimeIndex(np.repeat(dates.values, len(codes)))
+        df_all = pd.DataFrame(
+            rng.normal(size=(len(index), len(BASE_FEATURE_COLS))).astype(np.float32),
+            index=index, columns=BASE_FEATURE_COLS,
+        )
+        df_all["raw_return"] = rng.normal(size=len(index))
+        trainer._save_frame_cache(df_all, trainer._dataset_cache_path(codes, "1y", 5))
+
+        df_train, df_test, tcn_data = trainer.fetch_train_test_samples(codes, "1y", 5, use_cache=True)
+        assert len(df_train) > 0 and len(df_test) > 0 and tcn_data == {}
+        assert set(df_train["target"].unique()) <= {0, 1}
@@ -7,11 +7,11 @@ ML 모델 학습 스크립트
 실행 방법:
     python train_models.py
     python train_models.py --period 2y --future-days 5
+    python train_models.py --cache            # 당일 재실행 시 데이터 수집 생략
     koreanstocks train  ← 동일한 로직을 어디서든 실행
 """
 
 import argparse
-from koreanstocks.core.engine.trainer import run_training, DEFAULT_TRAINING_STOCKS
 
 
 def parse_args():
@@ -33,14 +33,23 @@ def parse_args():
         '--test-ratio', type=float, default=0.2,
         help='검증 세트 비율 (기본값: 0.2)'
     )
+    parser.add_argument(
+        '--cache', action='store_true',
+        help='당일 수집한 학습 데이터·종목별 OHLCV·지표·피처를 data/cache/ 에 저장·재사용'
+    )
     return parser.parse_args()
 
 
 if __name__ == '__main__':
+    # trainer 는 여기서 지연 import — 학습 프로세스 풀(spawn)은 __main__ 을 워커마다 다시 import 하므로,
+    # 모듈 최상단에서 import 하면 각 워커가 모델 라이브러리·torch 까지 불러온다 (cli.train 과 동일 방식)
+    from koreanstocks.core.engine.trainer import run_training, DEFAULT_TRAINING_STOCKS
+
     args = parse_args()
     run_training(
         period=args.period,
         future_days=args.future_days,
         stocks=args.stocks or DEFAULT_TRAINING_STOCKS,
         test_ratio=args.test_ratio,
+        use_cache=args.cache,
     )